@@ -20,15 +20,23 @@ from .display import (
 )
 from .models import Day, Task, TimerStatus
 from .storage import Storage
-from .telegram_bot import TelegramNotifier, test_connection_sync
-from .timer import TimerDaemon, get_timer_status
+
+# The timer daemon and Telegram modules (asyncio, signal handling) are
+# imported inside the commands that use them to keep CLI startup fast.
+
+
+# Process-wide storage instance, closed at exit by the storage module
+_storage: Optional[Storage] = None
 
 
 def get_storage() -> Storage:
-    """Get storage instance."""
-    cm = get_config_manager()
-    cm.ensure_dirs()
-    return Storage(cm.db_file)
+    """Get the shared storage instance."""
+    global _storage
+    if _storage is None:
+        cm = get_config_manager()
+        cm.ensure_dirs()
+        _storage = Storage(cm.db_file)
+    return _storage
 
 
 def require_setup(ctx: click.Context) -> None:
@@ -39,18 +47,29 @@ def require_setup(ctx: click.Context) -> None:
         ctx.exit(1)
 
 
+def print_version(ctx: click.Context, param: click.Parameter, value: bool) -> None:
+    """Print the version and exit before any subcommand is resolved."""
+    if not value or ctx.resilient_parsing:
+        return
+    click.echo(f"workday {__version__}")
+    ctx.exit()
+
+
 @click.group(invoke_without_command=True)
-@click.option("--version", is_flag=True, help="Show version")
+@click.option(
+    "--version",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=print_version,
+    help="Show version",
+)
 @click.pass_context
-def main(ctx: click.Context, version: bool) -> None:
+def main(ctx: click.Context) -> None:
     """Workday - Command-line pomodoro timer with Telegram notifications.
 
     Use 'workday start' to plan your day and 'workday timer' to begin.
     """
-    if version:
-        click.echo(f"workday {__version__}")
-        return
-
     if ctx.invoked_subcommand is None:
         # Show status by default
         cm = get_config_manager()
@@ -72,6 +91,8 @@ def main(ctx: click.Context, version: bool) -> None:
 @click.option("--telegram-chat-id", prompt=False, help="Telegram chat ID")
 def setup(telegram_token: Optional[str], telegram_chat_id: Optional[str]) -> None:
     """Configure Workday settings interactively."""
+    from .telegram_bot import test_connection_sync
+
     cm = get_config_manager()
     config = cm.load()
 
@@ -178,9 +199,7 @@ def start(ctx: click.Context) -> None:
         return
 
     # Save tasks
-    for desc in tasks:
-        task = Task(day_id=today.id, description=desc)
-        storage.create_task(task)
+    created = storage.create_tasks([Task(day_id=today.id, description=desc) for desc in tasks])
 
     # Get pomodoro estimate
     click.echo(f"\nYou have {len(tasks)} tasks.")
@@ -193,9 +212,7 @@ def start(ctx: click.Context) -> None:
     today.planned_pomodoros = planned
     today.started_at = datetime.now()  # Record when workday planning started
     storage.update_day(today)
-
-    # Reload day with tasks
-    today = storage.get_day(today.id)
+    today.tasks = today.tasks + created
 
     # Show plan
     print_day_plan(today)
@@ -205,7 +222,9 @@ def start(ctx: click.Context) -> None:
     cm = get_config_manager()
     config = cm.load()
     if config.telegram.enabled:
-        notifier = TelegramNotifier(config.telegram)
+        from .telegram_bot import TelegramNotifier
+
+        notifier = TelegramNotifier(config.telegram, detach=True)
         notifier.notify_day_start(planned, tasks)
         click.echo("\n📱 Plan sent to Telegram")
 
@@ -219,6 +238,8 @@ def start(ctx: click.Context) -> None:
 @click.pass_context
 def timer(ctx: click.Context, task: Optional[int]) -> None:
     """Start the pomodoro timer."""
+    from .timer import TimerDaemon, get_timer_status
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -268,6 +289,8 @@ def timer(ctx: click.Context, task: Optional[int]) -> None:
 @click.pass_context
 def pause(ctx: click.Context) -> None:
     """Pause the running timer."""
+    from .timer import TimerDaemon
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -283,6 +306,8 @@ def pause(ctx: click.Context) -> None:
 @click.pass_context
 def resume(ctx: click.Context) -> None:
     """Resume a paused timer."""
+    from .timer import TimerDaemon
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -298,6 +323,8 @@ def resume(ctx: click.Context) -> None:
 @click.pass_context
 def skip(ctx: click.Context) -> None:
     """Skip current focus or break period."""
+    from .timer import TimerDaemon
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -322,6 +349,8 @@ def skip(ctx: click.Context) -> None:
 @click.pass_context
 def stop_timer(ctx: click.Context) -> None:
     """Stop the timer completely."""
+    from .timer import TimerDaemon
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -341,6 +370,8 @@ def stop_timer(ctx: click.Context) -> None:
 @click.pass_context
 def status(ctx: click.Context) -> None:
     """Show current timer status and day progress."""
+    from .timer import get_timer_status
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -353,9 +384,9 @@ def status(ctx: click.Context) -> None:
         print_timer_status(state, config.timer)
 
     # Day progress
-    today = storage.get_today()
-    if today:
-        print_progress(today)
+    progress = storage.get_today_with_progress()
+    if progress:
+        print_progress(progress)
     else:
         click.echo("\nNo workday started. Run 'workday start' to plan your day.")
 
@@ -439,6 +470,8 @@ def task_list(ctx: click.Context) -> None:
 @click.pass_context
 def done(ctx: click.Context) -> None:
     """Complete your workday and show summary."""
+    from .timer import TimerDaemon, get_timer_status
+
     require_setup(ctx)
 
     cm = get_config_manager()
@@ -458,8 +491,7 @@ def done(ctx: click.Context) -> None:
         click.echo("No workday to complete.")
         return
 
-    # Update pomodoro count and end time
-    today.actual_pomodoros = storage.get_completed_pomodoro_count(today.id)
+    # Record end time; actual_pomodoros is kept current by the database
     today.ended_at = datetime.now()  # Record when workday ended
 
     # Ask for satisfaction rating
@@ -480,16 +512,15 @@ def done(ctx: click.Context) -> None:
     # Update streak
     streak = storage.update_streak(date.today().isoformat())
 
-    # Reload with tasks
-    today = storage.get_day(today.id)
-
     # Show summary
     print_day_summary(today, streak)
 
     # Send Telegram notification
     if config.telegram.enabled:
-        notifier = TelegramNotifier(config.telegram)
-        completed_tasks = sum(1 for t in today.tasks if t.completed)
+        from .telegram_bot import TelegramNotifier
+
+        notifier = TelegramNotifier(config.telegram, detach=True)
+        completed_tasks = storage.count_completed_tasks(today.id)
         notifier.notify_day_complete(
             today.actual_pomodoros,
             today.planned_pomodoros,
@@ -498,6 +529,9 @@ def done(ctx: click.Context) -> None:
         )
         click.echo("\n📱 Summary sent to Telegram")
 
+    # Once-a-day maintenance so the next day's queries use fresh statistics
+    storage.optimize()
+
 
 # ============================================================================
 # Statistics
@@ -513,8 +547,7 @@ def stats(ctx: click.Context) -> None:
 
     print_header("Statistics")
 
-    total_pomodoros = storage.get_total_pomodoros()
-    total_days = storage.get_total_days()
+    total_pomodoros, total_days = storage.get_totals()
     streak = storage.get_streak()
 
     click.echo(f"\nTotal pomodoros: {total_pomodoros}")
@@ -526,12 +559,14 @@ def stats(ctx: click.Context) -> None:
     recent = storage.get_recent_days(7)
     if recent:
         print_subheader("Recent Days")
+        lines = []
         for day in recent:
             completed = day.actual_pomodoros
             planned = day.planned_pomodoros
             pct = (completed / planned * 100) if planned > 0 else 0
             status = "✓" if completed >= planned else " "
-            click.echo(f"  {status} {day.date}: {completed}/{planned} ({pct:.0f}%)")
+            lines.append(f"  {status} {day.date}: {completed}/{planned} ({pct:.0f}%)")
+        click.echo("\n".join(lines))
 
 
 # ============================================================================
@@ -554,18 +589,21 @@ def history(ctx: click.Context, days: int) -> None:
 
     print_header(f"Last {len(recent)} Days")
 
+    # Render all days first and write them in one go
+    lines = []
     for day in recent:
-        click.echo(f"\n{day.date}")
+        lines.append(f"\n{day.date}")
         duration = day.duration_formatted()
         if duration:
-            click.echo(f"  Duration: {duration}")
-        click.echo(f"  Pomodoros: {day.actual_pomodoros}/{day.planned_pomodoros}")
-        click.echo(f"  Breaks: {day.email_breaks} email, {day.rest_breaks} rest")
+            lines.append(f"  Duration: {duration}")
+        lines.append(f"  Pomodoros: {day.actual_pomodoros}/{day.planned_pomodoros}")
+        lines.append(f"  Breaks: {day.email_breaks} email, {day.rest_breaks} rest")
         if day.satisfaction:
             stars = "★" * day.satisfaction + "☆" * (4 - day.satisfaction)
-            click.echo(f"  Satisfaction: {stars}")
+            lines.append(f"  Satisfaction: {stars}")
         if day.notes:
-            click.echo(f"  Notes: {day.notes}")
+            lines.append(f"  Notes: {day.notes}")
+    click.echo("\n".join(lines))
 
 
 if __name__ == "__main__":
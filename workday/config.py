@@ -1,14 +1,24 @@
 """Configuration management for Workday CLI."""
 
+import json
 import os
-from dataclasses import dataclass, field
+import sys
+import time
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
-import toml
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
 
-@dataclass
+# How long a get_pid() liveness check is reused, in seconds
+PID_CACHE_SECONDS = 0.5
+
+
+@dataclass(slots=True)
 class TelegramConfig:
     """Telegram bot configuration."""
     bot_token: str = ""
@@ -16,7 +26,7 @@ class TelegramConfig:
     enabled: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerConfig:
     """Timer duration settings."""
     focus_minutes: int = 25
@@ -25,7 +35,7 @@ class TimerConfig:
     long_break_after: int = 4  # pomodoros before long break
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main application configuration."""
     telegram: TelegramConfig = field(default_factory=TelegramConfig)
@@ -33,39 +43,56 @@ class Config:
 
     @classmethod
     def from_dict(cls, data: dict) -> "Config":
-        """Create Config from dictionary."""
+        """Create Config from dictionary.
+
+        Unknown keys are ignored; missing keys keep their defaults.
+        """
         telegram_data = data.get("telegram", {})
         timer_data = data.get("timer", {})
 
         return cls(
-            telegram=TelegramConfig(
-                bot_token=telegram_data.get("bot_token", ""),
-                chat_id=telegram_data.get("chat_id", ""),
-                enabled=telegram_data.get("enabled", False),
-            ),
-            timer=TimerConfig(
-                focus_minutes=timer_data.get("focus_minutes", 25),
-                short_break_minutes=timer_data.get("short_break_minutes", 5),
-                long_break_minutes=timer_data.get("long_break_minutes", 15),
-                long_break_after=timer_data.get("long_break_after", 4),
-            ),
+            telegram=TelegramConfig(**{
+                k: v for k, v in telegram_data.items()
+                if k in TelegramConfig.__dataclass_fields__
+            }),
+            timer=TimerConfig(**{
+                k: v for k, v in timer_data.items()
+                if k in TimerConfig.__dataclass_fields__
+            }),
         )
 
     def to_dict(self) -> dict:
         """Convert Config to dictionary."""
-        return {
-            "telegram": {
-                "bot_token": self.telegram.bot_token,
-                "chat_id": self.telegram.chat_id,
-                "enabled": self.telegram.enabled,
-            },
-            "timer": {
-                "focus_minutes": self.timer.focus_minutes,
-                "short_break_minutes": self.timer.short_break_minutes,
-                "long_break_minutes": self.timer.long_break_minutes,
-                "long_break_after": self.timer.long_break_after,
-            },
-        }
+        return asdict(self)
+
+
+def _toml_value(value) -> str:
+    """Format a scalar config value as a TOML literal."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int):
+        return str(value)
+    # JSON string escapes are valid TOML basic-string escapes
+    return json.dumps(str(value), ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def dump_toml(data: dict) -> str:
+    """Serialize a config dictionary of flat tables to TOML.
+
+    Args:
+        data: Mapping of table name to a dict of scalar values
+
+    Returns:
+        TOML document text
+    """
+    lines = []
+    for table, values in data.items():
+        if lines:
+            lines.append("")
+        lines.append(f"[{table}]")
+        for key, value in values.items():
+            lines.append(f"{key} = {_toml_value(value)}")
+    return "\n".join(lines) + "\n"
 
 
 class ConfigManager:
@@ -86,6 +113,11 @@ class ConfigManager:
         self.db_file = self.config_dir / "workday.db"
         self.state_file = self.config_dir / "timer.state"
         self.pid_file = self.config_dir / "timer.pid"
+        # Parsed config and the (mtime_ns, size) of the file it came from
+        self._cached: Optional[Config] = None
+        self._cached_stat: Optional[tuple[int, int]] = None
+        # (monotonic timestamp, pid) of the last liveness check
+        self._pid_cache: Optional[tuple[float, Optional[int]]] = None
 
     def ensure_dirs(self) -> None:
         """Create config directory if it doesn't exist."""
@@ -97,14 +129,23 @@ class ConfigManager:
         Returns:
             Config object with loaded or default values
         """
-        if not self.config_file.exists():
+        try:
+            st = self.config_file.stat()
+        except FileNotFoundError:
             return Config()
 
+        file_stat = (st.st_mtime_ns, st.st_size)
+        if self._cached is not None and self._cached_stat == file_stat:
+            return self._cached
+
         try:
-            data = toml.load(self.config_file)
-            return Config.from_dict(data)
+            with open(self.config_file, "rb") as f:
+                data = tomllib.load(f)
+            self._cached = Config.from_dict(data)
         except Exception:
             return Config()
+        self._cached_stat = file_stat
+        return self._cached
 
     def save(self, config: Config) -> None:
         """Save configuration to file.
@@ -114,7 +155,10 @@ class ConfigManager:
         """
         self.ensure_dirs()
         with open(self.config_file, "w") as f:
-            toml.dump(config.to_dict(), f)
+            f.write(dump_toml(config.to_dict()))
+        st = self.config_file.stat()
+        self._cached = config
+        self._cached_stat = (st.st_mtime_ns, st.st_size)
 
     def is_configured(self) -> bool:
         """Check if initial setup has been completed."""
@@ -123,14 +167,34 @@ class ConfigManager:
     def get_pid(self) -> Optional[int]:
         """Get the PID of the running timer daemon.
 
+        The result is reused for PID_CACHE_SECONDS so commands that check
+        the daemon several times only probe the process once.
+
         Returns:
             PID if timer is running, None otherwise
         """
-        if not self.pid_file.exists():
+        now = time.monotonic()
+        if self._pid_cache is not None and now - self._pid_cache[0] < PID_CACHE_SECONDS:
+            return self._pid_cache[1]
+
+        pid = self._read_pid()
+        self._pid_cache = (now, pid)
+        return pid
+
+    def _read_pid(self) -> Optional[int]:
+        """Read the PID file and check that the process is alive."""
+        try:
+            fd = os.open(self.pid_file, os.O_RDONLY)
+        except FileNotFoundError:
             return None
 
         try:
-            pid = int(self.pid_file.read_text().strip())
+            data = os.read(fd, 16)
+        finally:
+            os.close(fd)
+
+        try:
+            pid = int(data.strip())
             # Check if process is actually running
             os.kill(pid, 0)
             return pid
@@ -147,10 +211,12 @@ class ConfigManager:
         """
         self.ensure_dirs()
         self.pid_file.write_text(str(pid))
+        self._pid_cache = (time.monotonic(), pid)
 
     def clear_pid(self) -> None:
         """Remove PID file."""
         self.pid_file.unlink(missing_ok=True)
+        self._pid_cache = None
 
 
 # Global config manager instance
@@ -1,10 +1,14 @@
 """Display formatting for Workday CLI - ASCII art, progress bars, and UI."""
 
+import os
+import sys
+
 import click
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
-from .models import Day, Task, TimerState, TimerStatus, BreakType, Streak
+from .models import Day, DayProgress, Task, TimerState, TimerStatus, BreakType, Streak
 
 
 # ANSI color codes for terminals
@@ -33,7 +37,57 @@ TOMATO_ASCII = """
 
 TOMATO_SMALL = "🍅"
 
+# Colour is decided once per process: styling is skipped entirely when stdout
+# is not a terminal or NO_COLOR is set, instead of building escapes for
+# click.echo to strip again
+_USE_COLOR = sys.stdout is not None and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+# SGR parameters for the styles used below
+_SGR_BOLD = "1"
+_SGR_RED = "31"
+_SGR_GREEN = "32"
+_SGR_YELLOW = "33"
+
+
+def _sgr(text: str, *codes: str) -> str:
+    """Wrap text in a single combined SGR sequence.
+
+    click.style emits one escape per attribute; joining the parameters
+    gives e.g. ``ESC[1;31m`` instead of ``ESC[31mESC[1m``.
+
+    Args:
+        text: Text to style
+        codes: SGR parameters to apply
+
+    Returns:
+        Styled text followed by a single reset
+    """
+    if not _USE_COLOR:
+        return text
+    return f"\033[{';'.join(codes)}m{text}\033[0m"
+
+
+# Plural suffix indexed by (count != 1)
+_PLURAL = ("", "s")
+
+# Task status glyphs, styled once and indexed by task.completed
+_CHECK_GREEN = _sgr("✓", _SGR_GREEN)
+_CIRCLE_YELLOW = _sgr("○", _SGR_YELLOW)
+_CROSS_RED = _sgr("✗", _SGR_RED)
+_TASK_LIST_GLYPHS = (_CIRCLE_YELLOW, _CHECK_GREEN)
+_TASK_SUMMARY_GLYPHS = (_CROSS_RED, _CHECK_GREEN)
+_PLAN_GLYPHS = ("○", "✓")
 
+
+@lru_cache(maxsize=512)
+def _task_description(description: str, completed: bool) -> str:
+    """Style a task description, dimmed once completed."""
+    if not _USE_COLOR:
+        return description
+    return click.style(description, dim=completed)
+
+
+@lru_cache(maxsize=3601)
 def format_time(seconds: int) -> str:
     """Format seconds as MM:SS.
 
@@ -43,11 +97,16 @@ def format_time(seconds: int) -> str:
     Returns:
         Formatted time string
     """
-    minutes = seconds // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes:02d}:{secs:02d}"
 
 
+# Pre-built runs of the default bar characters, sliced by progress_bar
+_BAR_MAX = 64
+_FILLED_BAR = "█" * _BAR_MAX
+_EMPTY_BAR = "░" * _BAR_MAX
+
+
 def progress_bar(current: int, total: int, width: int = 20, filled: str = "█", empty: str = "░") -> str:
     """Create an ASCII progress bar.
 
@@ -61,13 +120,22 @@ def progress_bar(current: int, total: int, width: int = 20, filled: str = "█",
     Returns:
         Progress bar string
     """
-    if total == 0:
-        return empty * width
+    if total <= 0 or current <= 0:
+        filled_width = 0
+    elif current >= total:
+        filled_width = width
+    else:
+        filled_width = current * width // total
 
-    ratio = min(current / total, 1.0)
-    filled_width = int(width * ratio)
-    empty_width = width - filled_width
-    return filled * filled_width + empty * empty_width
+    if filled == "█" and empty == "░" and width <= _BAR_MAX:
+        return _FILLED_BAR[:filled_width] + _EMPTY_BAR[:width - filled_width]
+    return filled * filled_width + empty * (width - filled_width)
+
+
+# Pre-built icon runs; pomodoro_icons slices these instead of repeating
+_ICONS_MAX = 64
+_FILLED_ICONS = "●" * _ICONS_MAX
+_EMPTY_ICONS = "○" * _ICONS_MAX
 
 
 def pomodoro_icons(completed: int, planned: int) -> str:
@@ -80,10 +148,62 @@ def pomodoro_icons(completed: int, planned: int) -> str:
     Returns:
         String of tomato icons
     """
-    filled = "●" * completed
-    empty = "○" * max(0, planned - completed)
-    extra = "●" * max(0, completed - planned)
-    return filled + empty + extra
+    if completed > _ICONS_MAX or planned > _ICONS_MAX:
+        filled = "●" * completed
+        empty = "○" * max(0, planned - completed)
+        extra = "●" * max(0, completed - planned)
+        return filled + empty + extra
+    return (
+        _FILLED_ICONS[:completed]
+        + _EMPTY_ICONS[:max(0, planned - completed)]
+        + _FILLED_ICONS[:max(0, completed - planned)]
+    )
+
+
+# Header decorations, built once
+_HEADER_BAR = "═" * 50
+_SUBHEADER_PREFIX = "── "
+_SUBHEADER_SUFFIX = " ──"
+
+
+class _Out:
+    """Collect output lines and write them with a single click.echo."""
+
+    def __init__(self) -> None:
+        self.buf: list[str] = []
+
+    def __enter__(self) -> "_Out":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None and self.buf:
+            click.echo("\n".join(self.buf))
+
+    def line(self, text: str = "") -> None:
+        """Queue one line of output."""
+        self.buf.append(text)
+
+    def lines(self, texts: list[str]) -> None:
+        """Queue several lines of output."""
+        self.buf.extend(texts)
+
+    def header(self, text: str) -> None:
+        """Queue a styled header."""
+        self.buf += ["", _HEADER_BAR, f" {text}", _HEADER_BAR]
+
+    def subheader(self, text: str) -> None:
+        """Queue a styled subheader."""
+        self.buf += ["", f"{_SUBHEADER_PREFIX}{text}{_SUBHEADER_SUFFIX}"]
+
+    def tasks(self, tasks: list[Task]) -> None:
+        """Queue a non-empty task list."""
+        glyphs = _TASK_LIST_GLYPHS
+        describe = _task_description
+        self.buf.append("\nTasks:")
+        self.buf += [
+            f"  {glyphs[task.completed]} {task.position}. {describe(task.description, task.completed)}"
+            for task in tasks
+        ]
 
 
 def print_header(text: str) -> None:
@@ -92,11 +212,8 @@ def print_header(text: str) -> None:
     Args:
         text: Header text
     """
-    width = 50
-    click.echo()
-    click.echo("═" * width)
-    click.echo(f" {text}")
-    click.echo("═" * width)
+    with _Out() as out:
+        out.header(text)
 
 
 def print_subheader(text: str) -> None:
@@ -105,8 +222,30 @@ def print_subheader(text: str) -> None:
     Args:
         text: Subheader text
     """
-    click.echo()
-    click.echo(f"── {text} ──")
+    with _Out() as out:
+        out.subheader(text)
+
+
+# Styled timer headers and the TimerConfig field giving each phase's length,
+# keyed by (status, break_type)
+_BREAK_KINDS = (None, *BreakType)
+_STATUS_HEADERS = {
+    **{(TimerStatus.PAUSED, kind): _sgr("\n⏸  PAUSED", _SGR_BOLD, _SGR_YELLOW) for kind in _BREAK_KINDS},
+    **{(TimerStatus.FOCUS, kind): _sgr("\n🍅 FOCUS TIME", _SGR_BOLD, _SGR_RED) for kind in _BREAK_KINDS},
+    (TimerStatus.BREAK, BreakType.EMAIL): _sgr("\n📧 EMAIL BREAK", _SGR_BOLD, _SGR_GREEN),
+    (TimerStatus.BREAK, BreakType.LONG): _sgr("\n☕ LONG BREAK", _SGR_BOLD, _SGR_GREEN),
+    (TimerStatus.BREAK, BreakType.REST): _sgr("\n🧘 REST BREAK", _SGR_BOLD, _SGR_GREEN),
+    (TimerStatus.BREAK, None): _sgr("\n🧘 REST BREAK", _SGR_BOLD, _SGR_GREEN),
+}
+_TOTAL_MINUTES_FIELDS = {
+    (status, kind): (
+        "focus_minutes" if status == TimerStatus.FOCUS or (status == TimerStatus.PAUSED and kind is None)
+        else "long_break_minutes" if kind == BreakType.LONG
+        else "short_break_minutes"
+    )
+    for status in TimerStatus
+    for kind in _BREAK_KINDS
+}
 
 
 def print_timer_status(state: TimerState, config_timer: Optional[object] = None) -> None:
@@ -122,23 +261,8 @@ def print_timer_status(state: TimerState, config_timer: Optional[object] = None)
         click.echo("\nTimer is stopped.")
         return
 
-    if state.status == TimerStatus.PAUSED:
-        status_text = "PAUSED"
-        click.secho(f"\n⏸  {status_text}", fg="yellow", bold=True)
-    elif state.status == TimerStatus.FOCUS:
-        status_text = "FOCUS TIME"
-        click.secho(f"\n🍅 {status_text}", fg="red", bold=True)
-    elif state.status == TimerStatus.BREAK:
-        if state.break_type == BreakType.EMAIL:
-            status_text = "EMAIL BREAK"
-            icon = "📧"
-        elif state.break_type == BreakType.LONG:
-            status_text = "LONG BREAK"
-            icon = "☕"
-        else:
-            status_text = "REST BREAK"
-            icon = "🧘"
-        click.secho(f"\n{icon} {status_text}", fg="green", bold=True)
+    key = (state.status, state.break_type)
+    click.echo(_STATUS_HEADERS[key])
 
     # Time display
     click.echo(f"\n   {time_str}")
@@ -146,12 +270,7 @@ def print_timer_status(state: TimerState, config_timer: Optional[object] = None)
     # Progress bar
     if config_timer:
         # Determine total time based on current or paused state
-        if state.status == TimerStatus.FOCUS or (state.status == TimerStatus.PAUSED and state.break_type is None):
-            total_seconds = config_timer.focus_minutes * 60
-        elif state.break_type == BreakType.LONG:
-            total_seconds = config_timer.long_break_minutes * 60
-        else:
-            total_seconds = config_timer.short_break_minutes * 60
+        total_seconds = getattr(config_timer, _TOTAL_MINUTES_FIELDS[key]) * 60
         elapsed = total_seconds - state.time_remaining_seconds
         bar = progress_bar(elapsed, total_seconds, width=30)
         click.echo(f"   [{bar}]")
@@ -159,30 +278,41 @@ def print_timer_status(state: TimerState, config_timer: Optional[object] = None)
     click.echo(f"\n   Pomodoro #{state.current_pomodoro}")
 
 
+# Pre-formatted "HH:MM" for every minute of the day, indexed by hour * 60 + minute
+_MINUTES_PER_DAY = 24 * 60
+_HHMM = [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(60)]
+
+
+def _clock(moment: datetime) -> str:
+    """Format a datetime's wall-clock time as HH:MM."""
+    return _HHMM[moment.hour * 60 + moment.minute]
+
+
 def print_day_plan(day: Day) -> None:
     """Print the day's plan summary.
 
     Args:
         day: Day record to display
     """
-    print_header(f"Workday Plan - {day.date}")
-
-    click.echo(f"\nPlanned: {day.planned_pomodoros} pomodoros")
-
-    # Calculate estimated end time
-    total_minutes = day.planned_pomodoros * 30  # 25 min focus + 5 min break
-    from datetime import timedelta
-    now = datetime.now()
-    end_time = now + timedelta(minutes=total_minutes)
-    click.echo(f"Estimated completion: {end_time.strftime('%H:%M')}")
-
-    print_subheader("Tasks")
-    if day.tasks:
-        for i, task in enumerate(day.tasks, 1):
-            status = "✓" if task.completed else "○"
-            click.echo(f"  {status} {i}. {task.description}")
-    else:
-        click.echo("  No tasks planned")
+    with _Out() as out:
+        out.header(f"Workday Plan - {day.date}")
+
+        out.line(f"\nPlanned: {day.planned_pomodoros} pomodoros")
+
+        # Calculate estimated end time
+        total_minutes = day.planned_pomodoros * 30  # 25 min focus + 5 min break
+        now = datetime.now()
+        end = (now.hour * 60 + now.minute + total_minutes) % _MINUTES_PER_DAY
+        out.line(f"Estimated completion: {_HHMM[end]}")
+
+        out.subheader("Tasks")
+        if day.tasks:
+            out.lines([
+                f"  {_PLAN_GLYPHS[task.completed]} {i}. {task.description}"
+                for i, task in enumerate(day.tasks, 1)
+            ])
+        else:
+            out.line("  No tasks planned")
 
 
 def print_tasks(tasks: list[Task]) -> None:
@@ -195,42 +325,40 @@ def print_tasks(tasks: list[Task]) -> None:
         click.echo("No tasks for today.")
         return
 
-    click.echo("\nTasks:")
-    for task in tasks:
-        status = click.style("✓", fg="green") if task.completed else click.style("○", fg="yellow")
-        desc = click.style(task.description, dim=task.completed)
-        click.echo(f"  {status} {task.position}. {desc}")
+    with _Out() as out:
+        out.tasks(tasks)
 
 
-def print_progress(day: Day) -> None:
+def print_progress(progress: DayProgress) -> None:
     """Print day progress summary.
 
     Args:
-        day: Day record with current progress
+        progress: Day record with its completion counts
     """
-    completed = day.actual_pomodoros
+    day = progress.day
+    completed = progress.completed_pomodoros
     planned = day.planned_pomodoros
 
-    print_header(f"Progress - {day.date}")
+    with _Out() as out:
+        out.header(f"Progress - {day.date}")
 
-    # Pomodoro progress
-    click.echo(f"\nPomodoros: {completed}/{planned}")
-    icons = pomodoro_icons(completed, planned)
-    click.echo(f"  {icons}")
+        # Pomodoro progress
+        out.line(f"\nPomodoros: {completed}/{planned}")
+        icons = pomodoro_icons(completed, planned)
+        out.line(f"  {icons}")
 
-    # Progress bar
-    bar = progress_bar(completed, planned, width=30)
-    pct = (completed / planned * 100) if planned > 0 else 0
-    click.echo(f"  [{bar}] {pct:.0f}%")
+        # Progress bar
+        bar = progress_bar(completed, planned, width=30)
+        pct = (completed / planned * 100) if planned > 0 else 0
+        out.line(f"  [{bar}] {pct:.0f}%")
 
-    # Breaks
-    click.echo(f"\nBreaks: {day.email_breaks} email, {day.rest_breaks} rest")
+        # Breaks
+        out.line(f"\nBreaks: {day.email_breaks} email, {day.rest_breaks} rest")
 
-    # Tasks
-    if day.tasks:
-        completed_tasks = sum(1 for t in day.tasks if t.completed)
-        click.echo(f"\nTasks: {completed_tasks}/{len(day.tasks)} completed")
-        print_tasks(day.tasks)
+        # Tasks
+        if day.tasks:
+            out.line(f"\nTasks: {progress.completed_tasks}/{len(day.tasks)} completed")
+            out.tasks(day.tasks)
 
 
 def print_day_summary(day: Day, streak: Streak) -> None:
@@ -240,61 +368,71 @@ def print_day_summary(day: Day, streak: Streak) -> None:
         day: Day record to summarize
         streak: Current streak data
     """
-    print_header(f"Day Complete - {day.date}")
-
-    # Duration
-    duration = day.duration_formatted()
-    if duration:
-        click.echo(f"\nWorkday duration: {duration}")
-        if day.started_at and day.ended_at:
-            click.echo(f"  {day.started_at.strftime('%H:%M')} - {day.ended_at.strftime('%H:%M')}")
-
-    # Pomodoros
-    completed = day.actual_pomodoros
-    planned = day.planned_pomodoros
-    click.echo(f"\nPomodoros: {completed}/{planned} completed")
-    icons = pomodoro_icons(completed, planned)
-    click.echo(f"  {icons}")
-
-    if completed >= planned:
-        click.secho("  ✨ Goal achieved!", fg="green", bold=True)
-    elif completed > 0:
-        click.echo(f"  {planned - completed} short of goal")
-
-    # Task summary
-    if day.tasks:
-        completed_tasks = sum(1 for t in day.tasks if t.completed)
-        click.echo(f"\nTasks: {completed_tasks}/{len(day.tasks)} completed")
-        for task in day.tasks:
-            status = click.style("✓", fg="green") if task.completed else click.style("✗", fg="red")
-            click.echo(f"  {status} {task.description}")
-
-    # Breaks
-    click.echo(f"\nBreaks taken:")
-    click.echo(f"  📧 Email: {day.email_breaks}")
-    click.echo(f"  🧘 Rest: {day.rest_breaks}")
-
-    # Streak
-    click.echo(f"\nStreak: {streak.current_streak} day{'s' if streak.current_streak != 1 else ''}")
-    if streak.current_streak == streak.longest_streak and streak.current_streak > 1:
-        click.secho("  🏆 Personal best!", fg="yellow", bold=True)
-
-    # Satisfaction
-    if day.satisfaction:
-        stars = "★" * day.satisfaction + "☆" * (4 - day.satisfaction)
-        click.echo(f"\nSatisfaction: {stars}")
+    with _Out() as out:
+        out.header(f"Day Complete - {day.date}")
+
+        # Duration
+        duration = day.duration_formatted()
+        if duration:
+            out.line(f"\nWorkday duration: {duration}")
+            if day.started_at and day.ended_at:
+                out.line(f"  {_clock(day.started_at)} - {_clock(day.ended_at)}")
+
+        # Pomodoros
+        completed = day.actual_pomodoros
+        planned = day.planned_pomodoros
+        out.line(f"\nPomodoros: {completed}/{planned} completed")
+        icons = pomodoro_icons(completed, planned)
+        out.line(f"  {icons}")
+
+        if completed >= planned:
+            out.line(_sgr("  ✨ Goal achieved!", _SGR_BOLD, _SGR_GREEN))
+        elif completed > 0:
+            out.line(f"  {planned - completed} short of goal")
+
+        # Task summary
+        if day.tasks:
+            # Count completions while formatting rather than in a second pass
+            completed_tasks = 0
+            task_lines = []
+            append = task_lines.append
+            glyphs = _TASK_SUMMARY_GLYPHS
+            for task in day.tasks:
+                completed_tasks += task.completed
+                append(f"  {glyphs[task.completed]} {task.description}")
+            out.line(f"\nTasks: {completed_tasks}/{len(day.tasks)} completed")
+            out.lines(task_lines)
+
+        # Breaks
+        out.line(f"\nBreaks taken:\n  📧 Email: {day.email_breaks}\n  🧘 Rest: {day.rest_breaks}")
+
+        # Streak
+        current = streak.current_streak
+        out.line(f"\nStreak: {current} day{_PLURAL[current != 1]}")
+        if current == streak.longest_streak and current > 1:
+            out.line(_sgr("  🏆 Personal best!", _SGR_BOLD, _SGR_YELLOW))
+
+        # Satisfaction
+        if day.satisfaction:
+            stars = "★" * day.satisfaction + "☆" * (4 - day.satisfaction)
+            out.line(f"\nSatisfaction: {stars}")
+
+
+_SETUP_COMPLETE = "\n".join((
+    "",
+    _sgr("✓ Setup complete!", _SGR_BOLD, _SGR_GREEN),
+    "",
+    "Get started:",
+    "  workday start  - Plan your day",
+    "  workday timer  - Start a pomodoro",
+    "  workday status - Check progress",
+    "  workday --help - See all commands",
+))
 
 
 def print_setup_complete() -> None:
     """Print setup completion message."""
-    click.echo()
-    click.secho("✓ Setup complete!", fg="green", bold=True)
-    click.echo()
-    click.echo("Get started:")
-    click.echo("  workday start  - Plan your day")
-    click.echo("  workday timer  - Start a pomodoro")
-    click.echo("  workday status - Check progress")
-    click.echo("  workday --help - See all commands")
+    click.echo(_SETUP_COMPLETE)
 
 
 def print_notification_preview(message_type: str, message: str) -> None:
@@ -315,25 +453,30 @@ def print_timeline(planned_pomodoros: int, start_time: Optional[datetime] = None
         planned_pomodoros: Number of planned pomodoros
         start_time: Starting time (defaults to now)
     """
-    from datetime import timedelta
-
     if start_time is None:
         start_time = datetime.now()
 
-    click.echo("\nTimeline:")
-
-    current_time = start_time
-    for i in range(1, planned_pomodoros + 1):
-        # Focus block
-        focus_end = current_time + timedelta(minutes=25)
-        click.echo(f"  {current_time.strftime('%H:%M')}-{focus_end.strftime('%H:%M')} 🍅 Pomodoro #{i}")
-
-        # Break
-        current_time = focus_end
-        if i < planned_pomodoros:
-            break_type = "📧" if i % 2 == 1 else "🧘"
-            break_end = current_time + timedelta(minutes=5)
-            click.echo(f"  {current_time.strftime('%H:%M')}-{break_end.strftime('%H:%M')} {break_type} Break")
-            current_time = break_end
-
-    click.echo(f"\nEstimated finish: {current_time.strftime('%H:%M')}")
+    with _Out() as out:
+        out.line("\nTimeline:")
+
+        # Bind loop-invariant lookups to locals
+        line = out.line
+        hhmm = _HHMM
+        day_minutes = _MINUTES_PER_DAY
+
+        # Minutes since midnight, wrapping at the end of the day
+        current = start_time.hour * 60 + start_time.minute
+        for i in range(1, planned_pomodoros + 1):
+            # Focus block
+            start = current
+            current = (current + 25) % day_minutes
+            line(f"  {hhmm[start]}-{hhmm[current]} 🍅 Pomodoro #{i}")
+
+            # Break
+            if i < planned_pomodoros:
+                break_type = "📧" if i % 2 == 1 else "🧘"
+                start = current
+                current = (current + 5) % day_minutes
+                line(f"  {hhmm[start]}-{hhmm[current]} {break_type} Break")
+
+        out.line(f"\nEstimated finish: {hhmm[current]}")
@@ -1,9 +1,23 @@
 """Data models for Workday CLI."""
 
+import math
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Iterable, Optional
+
+
+def _from_epoch(value: Optional[int]) -> Optional[datetime]:
+    """Convert stored epoch seconds to a naive local datetime.
+
+    Args:
+        value: Seconds since the Unix epoch, or None
+
+    Returns:
+        Local datetime, or None
+    """
+    return None if value is None else datetime.fromtimestamp(value)
 
 
 class TimerStatus(Enum):
@@ -21,7 +35,12 @@ class BreakType(Enum):
     LONG = "long"
 
 
-@dataclass
+# Value -> member maps; indexing these skips Enum.__call__ when decoding state
+_TIMER_STATUS_BY_VALUE = {status.value: status for status in TimerStatus}
+_BREAK_TYPE_BY_VALUE = {break_type.value: break_type for break_type in BreakType}
+
+
+@dataclass(slots=True)
 class Task:
     """A task for the day."""
     id: Optional[int] = None
@@ -40,11 +59,17 @@ class Task:
             description=row[2],
             completed=bool(row[3]),
             position=row[4],
-            created_at=datetime.fromisoformat(row[5]) if row[5] else datetime.now(),
+            created_at=_from_epoch(row[5]) or datetime.now(),
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> list["Task"]:
+        """Create Tasks from database rows."""
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
+@dataclass(slots=True)
 class Pomodoro:
     """A single pomodoro session."""
     id: Optional[int] = None
@@ -61,13 +86,19 @@ class Pomodoro:
             id=row[0],
             day_id=row[1],
             task_id=row[2],
-            started_at=datetime.fromisoformat(row[3]) if row[3] else None,
-            completed_at=datetime.fromisoformat(row[4]) if row[4] else None,
+            started_at=_from_epoch(row[3]),
+            completed_at=_from_epoch(row[4]),
             duration_minutes=row[5],
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> list["Pomodoro"]:
+        """Create Pomodoros from database rows."""
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
 
-@dataclass
+@dataclass(slots=True)
 class Day:
     """A workday record."""
     id: Optional[int] = None
@@ -96,11 +127,17 @@ class Day:
             rest_breaks=row[5],
             satisfaction=row[6],
             notes=row[7] or "",
-            created_at=datetime.fromisoformat(row[8]) if row[8] else datetime.now(),
-            started_at=datetime.fromisoformat(row[9]) if len(row) > 9 and row[9] else None,
-            ended_at=datetime.fromisoformat(row[10]) if len(row) > 10 and row[10] else None,
+            created_at=_from_epoch(row[8]) or datetime.now(),
+            started_at=_from_epoch(row[9]) if len(row) > 9 else None,
+            ended_at=_from_epoch(row[10]) if len(row) > 10 else None,
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable) -> list["Day"]:
+        """Create Days from database rows."""
+        from_row = cls.from_row
+        return [from_row(row) for row in rows]
+
     def duration_seconds(self) -> Optional[int]:
         """Calculate workday duration in seconds."""
         if self.started_at and self.ended_at:
@@ -119,7 +156,15 @@ class Day:
         return f"{minutes}m"
 
 
-@dataclass
+@dataclass(slots=True)
+class DayProgress:
+    """A day together with its aggregated progress counts."""
+    day: Day
+    completed_pomodoros: int = 0
+    completed_tasks: int = 0
+
+
+@dataclass(slots=True)
 class Streak:
     """Streak tracking data."""
     id: Optional[int] = None
@@ -138,46 +183,64 @@ class Streak:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerState:
     """Current state of the timer daemon."""
     status: TimerStatus = TimerStatus.STOPPED
     break_type: Optional[BreakType] = None
     current_pomodoro: int = 0
     time_remaining_seconds: int = 0
-    started_at: Optional[datetime] = None
+    started_at: Optional[float] = None  # Epoch seconds the focus session started
     current_task_id: Optional[int] = None
     day_id: Optional[int] = None
+    ends_at: Optional[float] = None  # Epoch seconds the running phase ends
 
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
+        """Convert to dictionary for JSON serialization.
+
+        started_at is kept as epoch seconds in memory and written as a local
+        ISO timestamp.
+        """
+        break_type = self.break_type
+        started_at = self.started_at
         return {
             "status": self.status.value,
-            "break_type": self.break_type.value if self.break_type else None,
+            "break_type": None if break_type is None else break_type.value,
             "current_pomodoro": self.current_pomodoro,
             "time_remaining_seconds": self.time_remaining_seconds,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "started_at": None if started_at is None else datetime.fromtimestamp(started_at).isoformat(),
             "current_task_id": self.current_task_id,
             "day_id": self.day_id,
+            "ends_at": self.ends_at,
         }
 
     @classmethod
     def from_dict(cls, data: dict) -> "TimerState":
-        """Create TimerState from dictionary."""
+        """Create TimerState from dictionary.
+
+        While a phase is running the daemon only records when it ends, so
+        time_remaining_seconds is derived from ends_at at load time.
+        """
         break_type = None
         if data.get("break_type"):
-            break_type = BreakType(data["break_type"])
+            break_type = _BREAK_TYPE_BY_VALUE[data["break_type"]]
 
         started_at = None
         if data.get("started_at"):
-            started_at = datetime.fromisoformat(data["started_at"])
+            started_at = datetime.fromisoformat(data["started_at"]).timestamp()
+
+        time_remaining_seconds = data.get("time_remaining_seconds", 0)
+        ends_at = data.get("ends_at")
+        if ends_at is not None:
+            time_remaining_seconds = max(0, math.ceil(ends_at - time.time()))
 
         return cls(
-            status=TimerStatus(data.get("status", "stopped")),
+            status=_TIMER_STATUS_BY_VALUE[data.get("status", "stopped")],
             break_type=break_type,
             current_pomodoro=data.get("current_pomodoro", 0),
-            time_remaining_seconds=data.get("time_remaining_seconds", 0),
+            time_remaining_seconds=time_remaining_seconds,
             started_at=started_at,
             current_task_id=data.get("current_task_id"),
             day_id=data.get("day_id"),
+            ends_at=ends_at,
         )
@@ -1,17 +1,19 @@
 """SQLite database operations for Workday CLI."""
 
+import atexit
 import sqlite3
+import weakref
 from contextlib import contextmanager
 from datetime import datetime, date
 from pathlib import Path
-from typing import Optional, Iterator
+from typing import Iterator, Optional
 
-from .models import Day, Task, Pomodoro, Streak
+from .models import BreakType, Day, DayProgress, Task, Pomodoro, Streak
 
 
-SCHEMA = """
--- Daily plans
-CREATE TABLE IF NOT EXISTS days (
+# Timestamp columns hold integer Unix epoch seconds (see _epoch).
+DAYS_TABLE = """
+CREATE TABLE IF NOT EXISTS {name} (
     id INTEGER PRIMARY KEY,
     date TEXT UNIQUE NOT NULL,
     planned_pomodoros INTEGER DEFAULT 0,
@@ -20,30 +22,46 @@ CREATE TABLE IF NOT EXISTS days (
     rest_breaks INTEGER DEFAULT 0,
     satisfaction INTEGER,
     notes TEXT,
-    created_at TEXT,
-    started_at TEXT,
-    ended_at TEXT
+    created_at INTEGER,
+    started_at INTEGER,
+    ended_at INTEGER
 );
+"""
 
--- Tasks for each day
-CREATE TABLE IF NOT EXISTS tasks (
-    id INTEGER PRIMARY KEY,
-    day_id INTEGER REFERENCES days(id),
+# Tasks are always read per day, so they are clustered by (day_id, id).
+# Task IDs stay globally unique (idx_tasks_id) for lookups and pomodoros.
+TASKS_TABLE = """
+CREATE TABLE IF NOT EXISTS {name} (
+    id INTEGER NOT NULL,
+    day_id INTEGER NOT NULL REFERENCES days(id),
     description TEXT NOT NULL,
     completed INTEGER DEFAULT 0,
     position INTEGER,
-    created_at TEXT
-);
+    created_at INTEGER,
+    PRIMARY KEY (day_id, id)
+) WITHOUT ROWID;
+"""
 
--- Individual pomodoro records
-CREATE TABLE IF NOT EXISTS pomodoros (
+POMODOROS_TABLE = """
+CREATE TABLE IF NOT EXISTS {name} (
     id INTEGER PRIMARY KEY,
     day_id INTEGER REFERENCES days(id),
     task_id INTEGER REFERENCES tasks(id),
-    started_at TEXT,
-    completed_at TEXT,
+    started_at INTEGER,
+    completed_at INTEGER,
     duration_minutes INTEGER DEFAULT 25
 );
+"""
+
+SCHEMA = f"""
+-- Daily plans
+{DAYS_TABLE.format(name="days").strip()}
+
+-- Tasks for each day
+{TASKS_TABLE.format(name="tasks").strip()}
+
+-- Individual pomodoro records
+{POMODOROS_TABLE.format(name="pomodoros").strip()}
 
 -- Streak tracking
 CREATE TABLE IF NOT EXISTS streaks (
@@ -54,10 +72,209 @@ CREATE TABLE IF NOT EXISTS streaks (
 );
 
 -- Create indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_tasks_day_id ON tasks(day_id);
-CREATE INDEX IF NOT EXISTS idx_pomodoros_day_id ON pomodoros(day_id);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_tasks_id ON tasks(id);
+-- Covering indexes for the per-day completed counts
+CREATE INDEX IF NOT EXISTS idx_tasks_day_completed ON tasks(day_id, completed);
+CREATE INDEX IF NOT EXISTS idx_pomodoros_day_completed ON pomodoros(day_id, completed_at);
+-- Completed pomodoros only, for the all-time totals
+CREATE INDEX IF NOT EXISTS idx_pomodoros_completed ON pomodoros(day_id) WHERE completed_at IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_days_date ON days(date);
+
+-- days.actual_pomodoros is maintained here, not written by update_day
+CREATE TRIGGER IF NOT EXISTS trg_pomodoros_completed
+AFTER UPDATE OF completed_at ON pomodoros
+WHEN NEW.completed_at IS NOT NULL AND OLD.completed_at IS NULL
+BEGIN
+    UPDATE days SET actual_pomodoros = actual_pomodoros + 1 WHERE id = NEW.day_id;
+END;
+
+-- Pomodoros inserted already completed (bulk imports) count as well
+CREATE TRIGGER IF NOT EXISTS trg_pomodoros_inserted_completed
+AFTER INSERT ON pomodoros
+WHEN NEW.completed_at IS NOT NULL
+BEGIN
+    UPDATE days SET actual_pomodoros = actual_pomodoros + 1 WHERE id = NEW.day_id;
+END;
+"""
+
+# Stored in PRAGMA user_version once _init_db's migrations have run
+SCHEMA_VERSION = 4
+
+# UPDATE/INSERT ... RETURNING needs SQLite 3.35+
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Per-connection settings applied every time a connection is opened.
+# journal_mode=WAL is persistent and is set once in _init_db.
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous = NORMAL;
+PRAGMA busy_timeout = 5000;
+PRAGMA cache_size = -20000;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA foreign_keys = ON;
+"""
+
+# Statements are kept as constants so sqlite3's per-connection statement
+# cache (cached_statements=256) is hit on every call
+_SQL_INSERT_DAY = """
+    INSERT INTO days (date, planned_pomodoros, actual_pomodoros,
+                      email_breaks, rest_breaks, satisfaction, notes, created_at,
+                      started_at, ended_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_DAY = "SELECT * FROM days WHERE id = ?"
+# The no-op DO UPDATE makes RETURNING yield the row even if it already exists
+_SQL_UPSERT_DAY_RETURNING = """
+    INSERT INTO days (date, created_at) VALUES (?, ?)
+    ON CONFLICT(date) DO UPDATE SET date = excluded.date
+    RETURNING *
+"""
+_SQL_SELECT_DAY_BY_DATE = "SELECT * FROM days WHERE date = ?"
+_SQL_UPDATE_DAY = """
+    UPDATE days SET
+        planned_pomodoros = ?,
+        email_breaks = ?,
+        rest_breaks = ?,
+        satisfaction = ?,
+        notes = ?,
+        started_at = ?,
+        ended_at = ?
+    WHERE id = ?
 """
+_SQL_SELECT_RECENT_DAYS = "SELECT * FROM days ORDER BY date DESC LIMIT ?"
+_SQL_NEXT_TASK_POSITION = "SELECT COALESCE(MAX(position), 0) + 1 FROM tasks WHERE day_id = ?"
+_SQL_NEXT_TASK_ID = "SELECT COALESCE(MAX(id), 0) + 1 FROM tasks"
+_SQL_INSERT_TASK = """
+    INSERT INTO tasks (id, day_id, description, completed, position, created_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_SELECT_TASK = "SELECT * FROM tasks WHERE id = ?"
+_SQL_UPDATE_TASK = """
+    UPDATE tasks SET
+        description = ?,
+        completed = ?,
+        position = ?
+    WHERE id = ?
+"""
+_SQL_COMPLETE_TASK = "UPDATE tasks SET completed = 1 WHERE id = ?"
+_SQL_COUNT_COMPLETED_TASKS = "SELECT COUNT(*) FROM tasks WHERE day_id = ? AND completed = 1"
+_SQL_SELECT_TASKS_FOR_DAY = "SELECT * FROM tasks WHERE day_id = ? ORDER BY position"
+# actual_pomodoros is trigger-maintained, so it stands in for a COUNT over
+# the day's completed pomodoros
+_SQL_SELECT_DAY_PROGRESS_BY_DATE = """
+    WITH d AS (SELECT * FROM days WHERE date = ?)
+    SELECT d.*,
+        d.actual_pomodoros AS completed_pomodoros,
+        (SELECT COUNT(*) FROM tasks t WHERE t.day_id = d.id AND t.completed = 1)
+            AS completed_tasks
+    FROM d
+"""
+_SQL_NEXT_POMODORO_ID = "SELECT COALESCE(MAX(id), 0) + 1 FROM pomodoros"
+_SQL_INSERT_POMODORO = """
+    INSERT INTO pomodoros (id, day_id, task_id, started_at, completed_at, duration_minutes)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+_SQL_START_POMODORO = """
+    INSERT INTO pomodoros (day_id, task_id, started_at, duration_minutes)
+    VALUES (?, ?, ?, ?)
+"""
+_SQL_COMPLETE_POMODORO = "UPDATE pomodoros SET completed_at = ? WHERE id = ?"
+# Break types that are counted on the day row (long breaks are not)
+_SQL_COUNT_BREAK = {
+    BreakType.EMAIL: "UPDATE days SET email_breaks = email_breaks + 1 WHERE id = ?",
+    BreakType.REST: "UPDATE days SET rest_breaks = rest_breaks + 1 WHERE id = ?",
+}
+_SQL_SELECT_POMODOROS_FOR_DAY = "SELECT * FROM pomodoros WHERE day_id = ? ORDER BY started_at, id"
+# The single streak row always has id 1
+_SQL_INIT_STREAK = """
+    INSERT OR IGNORE INTO streaks (id, current_streak, longest_streak, last_active_date)
+    VALUES (1, 0, 0, '')
+"""
+_SQL_SELECT_STREAK = "SELECT * FROM streaks WHERE id = 1"
+# Continue the streak from yesterday, keep it on a repeat day, else restart.
+# SET expressions all see the old row, so longest_streak repeats the CASE.
+_SQL_ADVANCE_STREAK = """
+    UPDATE streaks SET
+        current_streak = CASE
+            WHEN last_active_date = :today THEN current_streak
+            WHEN last_active_date = date(:today, '-1 day') THEN current_streak + 1
+            ELSE 1 END,
+        longest_streak = MAX(longest_streak, CASE
+            WHEN last_active_date = :today THEN current_streak
+            WHEN last_active_date = date(:today, '-1 day') THEN current_streak + 1
+            ELSE 1 END),
+        last_active_date = :today
+    WHERE id = 1
+"""
+_SQL_RETURNING_STREAK = " RETURNING id, current_streak, longest_streak, last_active_date"
+_SQL_SELECT_TASKS_FOR_DAYS = "SELECT * FROM tasks WHERE day_id IN ({marks}) ORDER BY day_id, position"
+_SQL_SELECT_POMODOROS_FOR_DAYS = (
+    "SELECT * FROM pomodoros WHERE day_id IN ({marks}) ORDER BY day_id, started_at, id"
+)
+_SQL_SELECT_ACTUAL_POMODOROS = "SELECT actual_pomodoros FROM days WHERE id = ?"
+_SQL_BACKFILL_ACTUAL_POMODOROS = """
+    UPDATE days SET actual_pomodoros = (
+        SELECT COUNT(*) FROM pomodoros
+        WHERE day_id = days.id AND completed_at IS NOT NULL
+    )
+"""
+_SQL_SELECT_TOTALS = (
+    "SELECT COUNT(*), COUNT(DISTINCT day_id) FROM pomodoros WHERE completed_at IS NOT NULL"
+)
+
+# ISO text timestamp (local time) -> epoch seconds, for the migration
+_SQL_TEXT_TO_EPOCH = "CAST(strftime('%s', {column}, 'utc') AS INTEGER)"
+
+# Day IDs bound per IN (...) query, well under SQLite's 999-variable limit
+IN_CHUNK_SIZE = 500
+
+# Storages with an open connection, closed at exit and before daemonizing
+_open_storages: "weakref.WeakSet[Storage]" = weakref.WeakSet()
+
+
+def _epoch(value: Optional[datetime]) -> Optional[int]:
+    """Convert a naive local datetime to stored epoch seconds.
+
+    Args:
+        value: Datetime to store, or None
+
+    Returns:
+        Whole seconds since the Unix epoch, or None
+    """
+    return None if value is None else int(value.timestamp())
+
+
+def _execute_script(conn: sqlite3.Connection, script: str) -> None:
+    """Run each statement of an SQL script in the current transaction.
+
+    Unlike executescript(), this does not commit a pending transaction
+    first, so a script can run after checks made under the same lock.
+
+    Args:
+        conn: Connection to run the statements on
+        script: Semicolon-separated SQL statements
+    """
+    statement = ""
+    for part in script.split(";"):
+        statement += part + ";"
+        # Semicolons inside trigger bodies leave the statement incomplete
+        if sqlite3.complete_statement(statement):
+            if statement.strip().rstrip(";").strip():
+                conn.execute(statement)
+            statement = ""
+
+
+def close_open_storages() -> None:
+    """Close every open storage connection.
+
+    SQLite connections must not be carried across fork(), so the timer
+    calls this before daemonizing; they reopen on next use.
+    """
+    for storage in list(_open_storages):
+        storage.close()
+
+
+atexit.register(close_open_storages)
 
 
 class Storage:
@@ -70,39 +287,184 @@ class Storage:
             db_path: Path to SQLite database file
         """
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
         self._init_db()
 
     def _init_db(self) -> None:
-        """Initialize database schema."""
+        """Initialize database schema.
+
+        Schema creation and migrations only run while PRAGMA user_version
+        is below SCHEMA_VERSION, so an up-to-date database costs one read.
+        """
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         with self._connection() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return
+            conn.execute("PRAGMA journal_mode = WAL")
+            backfill_pomodoros = conn.execute(
+                "SELECT 1 FROM sqlite_master "
+                "WHERE type = 'trigger' AND name = 'trg_pomodoros_completed'"
+            ).fetchone() is None
             conn.executescript(SCHEMA)
+
+        with self._write() as conn:
             # Initialize streak record if not exists
-            cursor = conn.execute("SELECT COUNT(*) FROM streaks")
-            if cursor.fetchone()[0] == 0:
-                conn.execute(
-                    "INSERT INTO streaks (current_streak, longest_streak, last_active_date) "
-                    "VALUES (0, 0, '')"
-                )
+            conn.execute(_SQL_INIT_STREAK)
             # Migration: add started_at and ended_at columns if missing
             cursor = conn.execute("PRAGMA table_info(days)")
-            columns = [row[1] for row in cursor.fetchall()]
-            if "started_at" not in columns:
+            columns = cursor.fetchall()
+            names = {row[1] for row in columns}
+            if "started_at" not in names:
                 conn.execute("ALTER TABLE days ADD COLUMN started_at TEXT")
-            if "ended_at" not in columns:
+            if "ended_at" not in names:
                 conn.execute("ALTER TABLE days ADD COLUMN ended_at TEXT")
+            # Migration: recount actual_pomodoros once the trigger takes over
+            if backfill_pomodoros:
+                conn.execute(_SQL_BACKFILL_ACTUAL_POMODOROS)
+            # Migration: superseded by idx_pomodoros_day_completed
+            conn.execute("DROP INDEX IF EXISTS idx_pomodoros_day_id")
+            # Migration: ISO text timestamps become epoch integers
+            rebuild_tables = (
+                next(row[2] for row in columns if row[1] == "created_at").upper() != "INTEGER"
+            )
+            if not rebuild_tables:
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        if rebuild_tables:
+            with self._connection() as conn:
+                self._migrate_tables(conn)
+
+    def _migrate_tables(self, conn: sqlite3.Connection) -> None:
+        """Rebuild all tables in the current layout.
+
+        Text timestamps are converted to epoch seconds, and tasks become a
+        WITHOUT ROWID table keyed by day (orphaned tasks are dropped). The
+        layout is checked again under the write lock, and user_version is
+        set in the same transaction, so a process that lost the race to
+        migrate never converts already-converted timestamps.
+        """
+        # Foreign keys can only be toggled outside a transaction
+        conn.execute("PRAGMA foreign_keys = OFF")
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                columns = conn.execute("PRAGMA table_info(days)").fetchall()
+                created_at_type = next(row[2] for row in columns if row[1] == "created_at")
+                if created_at_type.upper() != "INTEGER":
+                    self._rebuild_tables(conn)
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.execute("PRAGMA foreign_keys = ON")
+
+    def _rebuild_tables(self, conn: sqlite3.Connection) -> None:
+        """Copy every table into the current layout in the open transaction."""
+        epoch = _SQL_TEXT_TO_EPOCH.format
+        _execute_script(
+            conn,
+            # The triggers name days and would block renaming it back
+            "DROP TRIGGER IF EXISTS trg_pomodoros_completed;"
+            "DROP TRIGGER IF EXISTS trg_pomodoros_inserted_completed;"
+            + DAYS_TABLE.format(name="days_new")
+            + TASKS_TABLE.format(name="tasks_new")
+            + POMODOROS_TABLE.format(name="pomodoros_new")
+            + f"""
+            INSERT INTO days_new
+                SELECT id, date, planned_pomodoros, actual_pomodoros, email_breaks,
+                       rest_breaks, satisfaction, notes, {epoch(column="created_at")},
+                       {epoch(column="started_at")}, {epoch(column="ended_at")}
+                FROM days;
+            INSERT INTO tasks_new
+                SELECT id, day_id, description, completed, position,
+                       {epoch(column="created_at")}
+                FROM tasks WHERE day_id IS NOT NULL;
+            INSERT INTO pomodoros_new
+                SELECT id, day_id, task_id, {epoch(column="started_at")},
+                       {epoch(column="completed_at")}, duration_minutes
+                FROM pomodoros;
+            DROP TABLE pomodoros;
+            DROP TABLE tasks;
+            DROP TABLE days;
+            ALTER TABLE days_new RENAME TO days;
+            ALTER TABLE tasks_new RENAME TO tasks;
+            ALTER TABLE pomodoros_new RENAME TO pomodoros;
+            """
+            # Recreate the indexes and triggers dropped with the tables
+            + SCHEMA,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a tuned connection to the database.
+
+        The connection runs in autocommit mode; writes take their own
+        transaction through _write().
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.executescript(CONNECTION_PRAGMAS)
+        return conn
 
     @contextmanager
     def _connection(self) -> Iterator[sqlite3.Connection]:
-        """Get database connection context manager."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get database connection context manager for reads.
+
+        The connection is opened on first use and kept until close().
+        """
+        if self._conn is None:
+            self._conn = self._connect()
+            _open_storages.add(self)
+        yield self._conn
+
+    @contextmanager
+    def _write(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in a BEGIN IMMEDIATE transaction.
+
+        Taking the write lock up front makes contention surface as a
+        busy wait at BEGIN instead of a failed lock upgrade mid-transaction.
+        Nested calls join the outer transaction.
+        """
+        with self._connection() as conn:
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Optimize and close the database connection, if open."""
+        if self._conn is None:
+            return
+        conn, self._conn = self._conn, None
+        _open_storages.discard(self)
         try:
-            yield conn
-            conn.commit()
+            conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            pass
         finally:
             conn.close()
 
+    def optimize(self) -> None:
+        """Refresh query planner statistics across all tables.
+
+        close() runs the cheaper PRAGMA optimize, which only considers
+        tables used by the connection; this checks every table.
+        """
+        with self._connection() as conn:
+            conn.execute("PRAGMA optimize = 0x10002")
+
     # Day operations
 
     def create_day(self, day: Day) -> Day:
@@ -114,14 +476,9 @@ class Storage:
         Returns:
             Day with assigned ID
         """
-        with self._connection() as conn:
+        with self._write() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO days (date, planned_pomodoros, actual_pomodoros,
-                                  email_breaks, rest_breaks, satisfaction, notes, created_at,
-                                  started_at, ended_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_DAY,
                 (
                     day.date,
                     day.planned_pomodoros,
@@ -130,9 +487,9 @@ class Storage:
                     day.rest_breaks,
                     day.satisfaction,
                     day.notes,
-                    day.created_at.isoformat(),
-                    day.started_at.isoformat() if day.started_at else None,
-                    day.ended_at.isoformat() if day.ended_at else None,
+                    _epoch(day.created_at),
+                    _epoch(day.started_at),
+                    _epoch(day.ended_at),
                 ),
             )
             day.id = cursor.lastrowid
@@ -148,12 +505,11 @@ class Storage:
             Day if found, None otherwise
         """
         with self._connection() as conn:
-            cursor = conn.execute("SELECT * FROM days WHERE id = ?", (day_id,))
+            cursor = conn.execute(_SQL_SELECT_DAY, (day_id,))
             row = cursor.fetchone()
             if row:
-                day = Day.from_row(tuple(row))
-                day.tasks = self.get_tasks_for_day(day_id)
-                day.pomodoros = self.get_pomodoros_for_day(day_id)
+                day = Day.from_row(row)
+                self._load_day_children(conn, [day])
                 return day
             return None
 
@@ -167,12 +523,11 @@ class Storage:
             Day if found, None otherwise
         """
         with self._connection() as conn:
-            cursor = conn.execute("SELECT * FROM days WHERE date = ?", (date_str,))
+            cursor = conn.execute(_SQL_SELECT_DAY_BY_DATE, (date_str,))
             row = cursor.fetchone()
             if row:
-                day = Day.from_row(tuple(row))
-                day.tasks = self.get_tasks_for_day(day.id)
-                day.pomodoros = self.get_pomodoros_for_day(day.id)
+                day = Day.from_row(row)
+                self._load_day_children(conn, [day])
                 return day
             return None
 
@@ -180,12 +535,52 @@ class Storage:
         """Get today's day record."""
         return self.get_day_by_date(date.today().isoformat())
 
+    def get_today_with_progress(self) -> Optional[DayProgress]:
+        """Get today's record with its tasks and completion counts.
+
+        The day row and both completion counts come from one CTE query,
+        enough on its own for a "goal met yet?" check; the tasks are read
+        separately for display and pomodoro records are not loaded.
+
+        Returns:
+            DayProgress if today has a record, None otherwise
+        """
+        with self._connection() as conn:
+            cursor = conn.execute(
+                _SQL_SELECT_DAY_PROGRESS_BY_DATE, (date.today().isoformat(),)
+            )
+            row = cursor.fetchone()
+            if not row:
+                return None
+            day = Day.from_row(row[:-2])
+            day.tasks = self.get_tasks_for_day(day.id)
+            return DayProgress(
+                day=day,
+                completed_pomodoros=row[-2],
+                completed_tasks=row[-1],
+            )
+
     def get_or_create_today(self) -> Day:
-        """Get today's record, creating if needed."""
+        """Get today's record, creating if needed.
+
+        A missing day is created and read back with one upsert, which also
+        returns the existing row if another process created it meanwhile.
+        """
         today = self.get_today()
         if today:
             return today
-        return self.create_day(Day(date=date.today().isoformat()))
+
+        today_str = date.today().isoformat()
+        if not HAS_RETURNING:
+            return self.create_day(Day(date=today_str))
+
+        with self._write() as conn:
+            cursor = conn.execute(
+                _SQL_UPSERT_DAY_RETURNING, (today_str, _epoch(datetime.now()))
+            )
+            day = Day.from_row(cursor.fetchone())
+            self._load_day_children(conn, [day])
+            return day
 
     def update_day(self, day: Day) -> None:
         """Update day record.
@@ -193,29 +588,17 @@ class Storage:
         Args:
             day: Day to update
         """
-        with self._connection() as conn:
+        with self._write() as conn:
             conn.execute(
-                """
-                UPDATE days SET
-                    planned_pomodoros = ?,
-                    actual_pomodoros = ?,
-                    email_breaks = ?,
-                    rest_breaks = ?,
-                    satisfaction = ?,
-                    notes = ?,
-                    started_at = ?,
-                    ended_at = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_DAY,
                 (
                     day.planned_pomodoros,
-                    day.actual_pomodoros,
                     day.email_breaks,
                     day.rest_breaks,
                     day.satisfaction,
                     day.notes,
-                    day.started_at.isoformat() if day.started_at else None,
-                    day.ended_at.isoformat() if day.ended_at else None,
+                    _epoch(day.started_at),
+                    _epoch(day.ended_at),
                     day.id,
                 ),
             )
@@ -230,17 +613,30 @@ class Storage:
             List of days, most recent first
         """
         with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM days ORDER BY date DESC LIMIT ?", (limit,)
-            )
-            days = []
-            for row in cursor.fetchall():
-                day = Day.from_row(tuple(row))
-                day.tasks = self.get_tasks_for_day(day.id)
-                day.pomodoros = self.get_pomodoros_for_day(day.id)
-                days.append(day)
+            cursor = conn.execute(_SQL_SELECT_RECENT_DAYS, (limit,))
+            days = Day.from_rows(cursor)
+            self._load_day_children(conn, days)
             return days
 
+    def _load_day_children(self, conn: sqlite3.Connection, days: list[Day]) -> None:
+        """Attach tasks and pomodoros to days, one query per table per chunk.
+
+        Args:
+            conn: Open connection
+            days: Days whose tasks and pomodoros lists are filled in
+        """
+        days_by_id = {day.id: day for day in days}
+        day_ids = list(days_by_id)
+        for start in range(0, len(day_ids), IN_CHUNK_SIZE):
+            chunk = day_ids[start:start + IN_CHUNK_SIZE]
+            marks = ",".join("?" * len(chunk))
+            cursor = conn.execute(_SQL_SELECT_TASKS_FOR_DAYS.format(marks=marks), chunk)
+            for task in Task.from_rows(cursor):
+                days_by_id[task.day_id].tasks.append(task)
+            cursor = conn.execute(_SQL_SELECT_POMODOROS_FOR_DAYS.format(marks=marks), chunk)
+            for pomodoro in Pomodoro.from_rows(cursor):
+                days_by_id[pomodoro.day_id].pomodoros.append(pomodoro)
+
     # Task operations
 
     def create_task(self, task: Task) -> Task:
@@ -252,30 +648,42 @@ class Storage:
         Returns:
             Task with assigned ID
         """
-        with self._connection() as conn:
-            # Get next position
-            cursor = conn.execute(
-                "SELECT COALESCE(MAX(position), 0) + 1 FROM tasks WHERE day_id = ?",
-                (task.day_id,),
-            )
-            position = cursor.fetchone()[0]
-            task.position = position
+        return self.create_tasks([task])[0]
 
-            cursor = conn.execute(
-                """
-                INSERT INTO tasks (day_id, description, completed, position, created_at)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    task.day_id,
-                    task.description,
-                    int(task.completed),
-                    task.position,
-                    task.created_at.isoformat(),
-                ),
+    def create_tasks(self, tasks: list[Task]) -> list[Task]:
+        """Create several tasks for one day in a single transaction.
+
+        Args:
+            tasks: Tasks to create, all with the same day_id
+
+        Returns:
+            Tasks with assigned IDs and positions
+        """
+        if not tasks:
+            return tasks
+
+        with self._write() as conn:
+            first_position = conn.execute(_SQL_NEXT_TASK_POSITION, (tasks[0].day_id,)).fetchone()[0]
+            first_id = conn.execute(_SQL_NEXT_TASK_ID).fetchone()[0]
+            for offset, task in enumerate(tasks):
+                task.id = first_id + offset
+                task.position = first_position + offset
+
+            conn.executemany(
+                _SQL_INSERT_TASK,
+                [
+                    (
+                        task.id,
+                        task.day_id,
+                        task.description,
+                        int(task.completed),
+                        task.position,
+                        _epoch(task.created_at),
+                    )
+                    for task in tasks
+                ],
             )
-            task.id = cursor.lastrowid
-            return task
+            return tasks
 
     def get_task(self, task_id: int) -> Optional[Task]:
         """Get task by ID.
@@ -287,10 +695,10 @@ class Storage:
             Task if found, None otherwise
         """
         with self._connection() as conn:
-            cursor = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,))
+            cursor = conn.execute(_SQL_SELECT_TASK, (task_id,))
             row = cursor.fetchone()
             if row:
-                return Task.from_row(tuple(row))
+                return Task.from_row(row)
             return None
 
     def get_tasks_for_day(self, day_id: int) -> list[Task]:
@@ -303,10 +711,8 @@ class Storage:
             List of tasks ordered by position
         """
         with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM tasks WHERE day_id = ? ORDER BY position", (day_id,)
-            )
-            return [Task.from_row(tuple(row)) for row in cursor.fetchall()]
+            cursor = conn.execute(_SQL_SELECT_TASKS_FOR_DAY, (day_id,))
+            return Task.from_rows(cursor)
 
     def update_task(self, task: Task) -> None:
         """Update task record.
@@ -314,26 +720,32 @@ class Storage:
         Args:
             task: Task to update
         """
-        with self._connection() as conn:
+        with self._write() as conn:
             conn.execute(
-                """
-                UPDATE tasks SET
-                    description = ?,
-                    completed = ?,
-                    position = ?
-                WHERE id = ?
-                """,
+                _SQL_UPDATE_TASK,
                 (task.description, int(task.completed), task.position, task.id),
             )
 
+    def count_completed_tasks(self, day_id: int) -> int:
+        """Get count of completed tasks for a day.
+
+        Args:
+            day_id: Day ID
+
+        Returns:
+            Number of completed tasks
+        """
+        with self._connection() as conn:
+            return conn.execute(_SQL_COUNT_COMPLETED_TASKS, (day_id,)).fetchone()[0]
+
     def complete_task(self, task_id: int) -> None:
         """Mark task as completed.
 
         Args:
             task_id: Task ID
         """
-        with self._connection() as conn:
-            conn.execute("UPDATE tasks SET completed = 1 WHERE id = ?", (task_id,))
+        with self._write() as conn:
+            conn.execute(_SQL_COMPLETE_TASK, (task_id,))
 
     # Pomodoro operations
 
@@ -346,22 +758,66 @@ class Storage:
         Returns:
             Pomodoro with assigned ID
         """
-        with self._connection() as conn:
+        return self.create_pomodoros([pomodoro])[0]
+
+    def create_pomodoros(self, pomodoros: list[Pomodoro]) -> list[Pomodoro]:
+        """Create several pomodoro records in a single transaction.
+
+        IDs are assigned contiguously from the current maximum while the
+        write lock is held, so all rows go in with one executemany.
+
+        Args:
+            pomodoros: Pomodoros to create
+
+        Returns:
+            Pomodoros with assigned IDs
+        """
+        if not pomodoros:
+            return pomodoros
+
+        with self._write() as conn:
+            first_id = conn.execute(_SQL_NEXT_POMODORO_ID).fetchone()[0]
+            for offset, pomodoro in enumerate(pomodoros):
+                pomodoro.id = first_id + offset
+
+            conn.executemany(
+                _SQL_INSERT_POMODORO,
+                [
+                    (
+                        pomodoro.id,
+                        pomodoro.day_id,
+                        pomodoro.task_id,
+                        _epoch(pomodoro.started_at),
+                        _epoch(pomodoro.completed_at),
+                        pomodoro.duration_minutes,
+                    )
+                    for pomodoro in pomodoros
+                ],
+            )
+            return pomodoros
+
+    def start_pomodoro(
+        self, day_id: int, task_id: Optional[int], started_at: float, duration_minutes: int
+    ) -> int:
+        """Insert a started pomodoro from plain values.
+
+        Used by the timer daemon, which only needs the new row's ID and so
+        skips building a Pomodoro for each focus session.
+
+        Args:
+            day_id: Day ID
+            task_id: Task being worked on, or None
+            started_at: Start time in seconds since the Unix epoch
+            duration_minutes: Planned focus duration
+
+        Returns:
+            ID of the new pomodoro
+        """
+        with self._write() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO pomodoros (day_id, task_id, started_at, completed_at, duration_minutes)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (
-                    pomodoro.day_id,
-                    pomodoro.task_id,
-                    pomodoro.started_at.isoformat() if pomodoro.started_at else None,
-                    pomodoro.completed_at.isoformat() if pomodoro.completed_at else None,
-                    pomodoro.duration_minutes,
-                ),
+                _SQL_START_POMODORO, (day_id, task_id, int(started_at), duration_minutes)
             )
-            pomodoro.id = cursor.lastrowid
-            return pomodoro
+            return cursor.lastrowid
 
     def complete_pomodoro(self, pomodoro_id: int) -> None:
         """Mark pomodoro as completed.
@@ -369,11 +825,25 @@ class Storage:
         Args:
             pomodoro_id: Pomodoro ID
         """
-        with self._connection() as conn:
-            conn.execute(
-                "UPDATE pomodoros SET completed_at = ? WHERE id = ?",
-                (datetime.now().isoformat(), pomodoro_id),
-            )
+        with self._write() as conn:
+            conn.execute(_SQL_COMPLETE_POMODORO, (_epoch(datetime.now()), pomodoro_id))
+
+    def finish_focus(self, pomodoro_id: int, day_id: int, break_type: BreakType) -> None:
+        """Complete a pomodoro and count the break that follows it.
+
+        Both changes are made in one transaction, as increments in SQL, so
+        the day row is neither read first nor overwritten as a whole.
+
+        Args:
+            pomodoro_id: Pomodoro ID
+            day_id: Day the pomodoro belongs to
+            break_type: Break starting now; email and rest breaks are counted
+        """
+        with self._write() as conn:
+            conn.execute(_SQL_COMPLETE_POMODORO, (_epoch(datetime.now()), pomodoro_id))
+            count_break = _SQL_COUNT_BREAK.get(break_type)
+            if count_break is not None:
+                conn.execute(count_break, (day_id,))
 
     def get_pomodoros_for_day(self, day_id: int) -> list[Pomodoro]:
         """Get all pomodoros for a day.
@@ -385,10 +855,8 @@ class Storage:
             List of pomodoros
         """
         with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT * FROM pomodoros WHERE day_id = ? ORDER BY started_at", (day_id,)
-            )
-            return [Pomodoro.from_row(tuple(row)) for row in cursor.fetchall()]
+            cursor = conn.execute(_SQL_SELECT_POMODOROS_FOR_DAY, (day_id,))
+            return Pomodoro.from_rows(cursor)
 
     def get_completed_pomodoro_count(self, day_id: int) -> int:
         """Get count of completed pomodoros for a day.
@@ -400,11 +868,7 @@ class Storage:
             Number of completed pomodoros
         """
         with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM pomodoros WHERE day_id = ? AND completed_at IS NOT NULL",
-                (day_id,),
-            )
-            return cursor.fetchone()[0]
+            return (conn.execute(_SQL_SELECT_ACTUAL_POMODOROS, (day_id,)).fetchone() or (0,))[0]
 
     # Streak operations
 
@@ -415,84 +879,47 @@ class Storage:
             Streak record
         """
         with self._connection() as conn:
-            cursor = conn.execute("SELECT * FROM streaks LIMIT 1")
-            row = cursor.fetchone()
+            row = conn.execute(_SQL_SELECT_STREAK).fetchone()
             if row:
-                return Streak.from_row(tuple(row))
+                return Streak.from_row(row)
             return Streak()
 
     def update_streak(self, today_str: str) -> Streak:
         """Update streak based on activity.
 
+        The whole update is one statement, so concurrent processes cannot
+        both read the old streak and double-count a day.
+
         Args:
             today_str: Today's date in YYYY-MM-DD format
 
         Returns:
             Updated streak
         """
-        streak = self.get_streak()
+        params = {"today": today_str}
+        with self._write() as conn:
+            if not HAS_RETURNING:
+                conn.execute(_SQL_ADVANCE_STREAK, params)
+                return Streak.from_row(conn.execute(_SQL_SELECT_STREAK).fetchone())
 
-        # Check if today already counted
-        if streak.last_active_date == today_str:
-            return streak
+            cursor = conn.execute(_SQL_ADVANCE_STREAK + _SQL_RETURNING_STREAK, params)
+            return Streak.from_row(cursor.fetchone())
 
-        # Calculate yesterday
-        today = date.fromisoformat(today_str)
-        yesterday = (today - __import__("datetime").timedelta(days=1)).isoformat()
-
-        if streak.last_active_date == yesterday:
-            # Continue streak
-            streak.current_streak += 1
-        elif streak.last_active_date == "":
-            # First activity
-            streak.current_streak = 1
-        else:
-            # Streak broken, start fresh
-            streak.current_streak = 1
-
-        # Update longest if needed
-        if streak.current_streak > streak.longest_streak:
-            streak.longest_streak = streak.current_streak
+    # Statistics
 
-        streak.last_active_date = today_str
+    def get_totals(self) -> tuple[int, int]:
+        """Get all-time totals with a single query.
 
-        # Save to database
+        Returns:
+            Tuple of (completed pomodoros, days with a completed pomodoro)
+        """
         with self._connection() as conn:
-            conn.execute(
-                """
-                UPDATE streaks SET
-                    current_streak = ?,
-                    longest_streak = ?,
-                    last_active_date = ?
-                WHERE id = ?
-                """,
-                (
-                    streak.current_streak,
-                    streak.longest_streak,
-                    streak.last_active_date,
-                    streak.id,
-                ),
-            )
-
-        return streak
-
-    # Statistics
+            return conn.execute(_SQL_SELECT_TOTALS).fetchone()
 
     def get_total_pomodoros(self) -> int:
         """Get total completed pomodoros across all days."""
-        with self._connection() as conn:
-            cursor = conn.execute(
-                "SELECT COUNT(*) FROM pomodoros WHERE completed_at IS NOT NULL"
-            )
-            return cursor.fetchone()[0]
+        return self.get_totals()[0]
 
     def get_total_days(self) -> int:
         """Get total days with at least one completed pomodoro."""
-        with self._connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT COUNT(DISTINCT day_id) FROM pomodoros
-                WHERE completed_at IS NOT NULL
-                """
-            )
-            return cursor.fetchone()[0]
+        return self.get_totals()[1]
@@ -1,7 +1,11 @@
 """Telegram notification handler for Workday CLI."""
 
 import asyncio
+import atexit
+import concurrent.futures
 import logging
+import os
+import threading
 from typing import Optional
 
 from .config import TelegramConfig
@@ -9,34 +13,73 @@ from .models import BreakType
 
 logger = logging.getLogger(__name__)
 
+# Per-break-type (emoji, title, suggestion) and the message they fill in
+_BREAK_TEMPLATES = {
+    BreakType.EMAIL: ("📧", "Email Break", "Check your inbox, respond to messages."),
+    BreakType.LONG: ("☕", "Long Break", "Stretch, grab a coffee, take a walk."),
+    BreakType.REST: ("🧘", "Rest Break", "Step away from the screen. Stretch. Breathe."),
+}
+_BREAK_MESSAGE = "{emoji} <b>{title}</b>\n\n{minutes} minutes.\n{suggestion}"
+
+# Seconds send_sync waits for the background loop to deliver a message
+SEND_TIMEOUT = 5.0
+
+# telegram.Bot, imported on first use
+_Bot = None
+
+
+def _get_bot_class():
+    """Import python-telegram-bot's Bot class once and cache it.
+
+    Returns:
+        The telegram.Bot class
+
+    Raises:
+        ImportError: If python-telegram-bot is not installed
+    """
+    global _Bot
+    if _Bot is None:
+        from telegram import Bot
+        _Bot = Bot
+    return _Bot
+
 
 class TelegramNotifier:
     """Handles sending notifications to Telegram."""
 
-    def __init__(self, config: TelegramConfig):
+    def __init__(self, config: TelegramConfig, detach: bool = False, background: bool = False):
         """Initialize notifier with config.
 
         Args:
             config: Telegram configuration
+            detach: Send notifications from a detached child process so
+                the caller never waits on the network
+            background: Queue notifications on the background event loop
+                and return immediately (for long-running processes)
         """
         self.config = config
+        # The config is not changed while a notifier is alive
+        self._enabled = bool(config.enabled and config.bot_token and config.chat_id)
+        self.detach = detach
+        self.background = background
         self._bot = None
+        self._pending: set[concurrent.futures.Future] = set()
+        self._flush_registered = False
+        # Background event loop shared by all sends, so the Bot and its
+        # HTTP connection pool outlive a single message
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_pid: Optional[int] = None
 
     @property
     def enabled(self) -> bool:
         """Check if Telegram notifications are enabled and configured."""
-        return (
-            self.config.enabled
-            and bool(self.config.bot_token)
-            and bool(self.config.chat_id)
-        )
+        return self._enabled
 
     async def _get_bot(self):
         """Get or create bot instance."""
         if self._bot is None:
             try:
-                from telegram import Bot
-                self._bot = Bot(token=self.config.bot_token)
+                self._bot = _get_bot_class()(token=self.config.bot_token)
             except ImportError:
                 logger.warning("python-telegram-bot not installed")
                 return None
@@ -54,7 +97,7 @@ class TelegramNotifier:
         Returns:
             True if sent successfully, False otherwise
         """
-        if not self.enabled:
+        if not self._enabled:
             return False
 
         try:
@@ -72,24 +115,133 @@ class TelegramNotifier:
             logger.error(f"Failed to send message: {e}")
             return False
 
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Get the background event loop, starting its thread on first use.
+
+        Threads do not survive fork(), so a loop started by another process
+        (e.g. before the timer daemonized) is replaced along with its Bot.
+        """
+        pid = os.getpid()
+        if self._loop is None or self._loop_pid != pid:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="telegram-notifier", daemon=True
+            )
+            thread.start()
+            self._loop = loop
+            self._loop_pid = pid
+            self._bot = None
+            self._pending.clear()
+        return self._loop
+
     def send_sync(self, text: str) -> bool:
         """Synchronous wrapper for send_message.
 
+        The message is sent on the background event loop, reusing its Bot.
+
         Args:
             text: Message text to send
 
         Returns:
             True if sent successfully, False otherwise
         """
-        if not self.enabled:
+        if not self._enabled:
             return False
 
         try:
-            return asyncio.run(self.send_message(text))
+            future = asyncio.run_coroutine_threadsafe(
+                self.send_message(text), self._ensure_loop()
+            )
+            return future.result(timeout=SEND_TIMEOUT)
         except Exception as e:
             logger.error(f"Failed to send message synchronously: {e}")
             return False
 
+    def send_background(self, text: str) -> bool:
+        """Queue a message on the background event loop without waiting.
+
+        Failures are logged when the send completes; sends still pending
+        at interpreter exit are waited for by flush().
+
+        Args:
+            text: Message text to send
+
+        Returns:
+            True if the message was queued, False otherwise
+        """
+        if not self._enabled:
+            return False
+
+        try:
+            future = asyncio.run_coroutine_threadsafe(
+                self.send_message(text), self._ensure_loop()
+            )
+        except Exception as e:
+            logger.error(f"Failed to queue message: {e}")
+            return False
+
+        self._pending.add(future)
+        future.add_done_callback(self._send_done)
+        if not self._flush_registered:
+            atexit.register(self.flush)
+            self._flush_registered = True
+        return True
+
+    def _send_done(self, future: concurrent.futures.Future) -> None:
+        """Forget a finished background send, logging unexpected errors."""
+        self._pending.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Failed to send message: {future.exception()}")
+
+    def flush(self, timeout: float = SEND_TIMEOUT) -> None:
+        """Wait for queued background sends to finish.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        if self._pending:
+            concurrent.futures.wait(list(self._pending), timeout=timeout)
+
+    def send_detached(self, text: str) -> bool:
+        """Send a message from a forked child process without waiting.
+
+        Args:
+            text: Message text to send
+
+        Returns:
+            True if the sender was started, False otherwise
+        """
+        if not self._enabled:
+            return False
+
+        try:
+            pid = os.fork()
+        except OSError as e:
+            logger.error(f"Failed to fork notification sender: {e}")
+            return self.send_sync(text)
+
+        if pid > 0:
+            return True
+
+        # Child: leave the terminal session, send, and exit without running
+        # the parent's atexit handlers
+        try:
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDWR)
+            for fd in (0, 1, 2):
+                os.dup2(devnull, fd)
+            self.send_sync(text)
+        finally:
+            os._exit(0)
+
+    def _deliver(self, text: str) -> bool:
+        """Send a message using the configured delivery mode."""
+        if self.detach:
+            return self.send_detached(text)
+        if self.background:
+            return self.send_background(text)
+        return self.send_sync(text)
+
     # Predefined notification messages
 
     def notify_focus_start(self, pomodoro_num: int, task_name: Optional[str] = None) -> bool:
@@ -104,7 +256,7 @@ class TelegramNotifier:
         """
         task_text = f"\nTask: {task_name}" if task_name else ""
         message = f"🍅 <b>Focus Time</b>\n\nPomodoro #{pomodoro_num} started.{task_text}\n\n25 minutes of focused work."
-        return self.send_sync(message)
+        return self._deliver(message)
 
     def notify_focus_complete(self, pomodoro_num: int) -> bool:
         """Send notification for focus session completion.
@@ -116,7 +268,7 @@ class TelegramNotifier:
             True if sent successfully
         """
         message = f"✅ <b>Pomodoro #{pomodoro_num} Complete!</b>\n\nGreat work! Time for a break."
-        return self.send_sync(message)
+        return self._deliver(message)
 
     def notify_break_start(self, break_type: BreakType, duration_minutes: int) -> bool:
         """Send notification for break start.
@@ -128,21 +280,13 @@ class TelegramNotifier:
         Returns:
             True if sent successfully
         """
-        if break_type == BreakType.EMAIL:
-            emoji = "📧"
-            title = "Email Break"
-            suggestion = "Check your inbox, respond to messages."
-        elif break_type == BreakType.LONG:
-            emoji = "☕"
-            title = "Long Break"
-            suggestion = "Stretch, grab a coffee, take a walk."
-        else:
-            emoji = "🧘"
-            title = "Rest Break"
-            suggestion = "Step away from the screen. Stretch. Breathe."
-
-        message = f"{emoji} <b>{title}</b>\n\n{duration_minutes} minutes.\n{suggestion}"
-        return self.send_sync(message)
+        emoji, title, suggestion = _BREAK_TEMPLATES.get(
+            break_type, _BREAK_TEMPLATES[BreakType.REST]
+        )
+        message = _BREAK_MESSAGE.format(
+            emoji=emoji, title=title, minutes=duration_minutes, suggestion=suggestion
+        )
+        return self._deliver(message)
 
     def notify_break_end(self) -> bool:
         """Send notification for break ending.
@@ -151,7 +295,7 @@ class TelegramNotifier:
             True if sent successfully
         """
         message = "⏰ <b>Break Over</b>\n\nReady for the next pomodoro?"
-        return self.send_sync(message)
+        return self._deliver(message)
 
     def notify_day_start(self, planned_pomodoros: int, tasks: list[str]) -> bool:
         """Send notification for day start.
@@ -169,7 +313,7 @@ class TelegramNotifier:
             f"Plan: {planned_pomodoros} pomodoros\n\n"
             f"<b>Tasks:</b>\n{task_list}"
         )
-        return self.send_sync(message)
+        return self._deliver(message)
 
     def notify_day_complete(
         self,
@@ -203,7 +347,7 @@ class TelegramNotifier:
         elif completed_pomodoros > 0:
             message += f"\n{planned_pomodoros - completed_pomodoros} short of goal."
 
-        return self.send_sync(message)
+        return self._deliver(message)
 
     def notify_timer_paused(self) -> bool:
         """Send notification for timer pause.
@@ -212,7 +356,7 @@ class TelegramNotifier:
             True if sent successfully
         """
         message = "⏸️ <b>Timer Paused</b>\n\nResume when ready."
-        return self.send_sync(message)
+        return self._deliver(message)
 
     def notify_timer_resumed(self, time_remaining: str) -> bool:
         """Send notification for timer resume.
@@ -224,7 +368,7 @@ class TelegramNotifier:
             True if sent successfully
         """
         message = f"▶️ <b>Timer Resumed</b>\n\n{time_remaining} remaining."
-        return self.send_sync(message)
+        return self._deliver(message)
 
 
 async def test_telegram_connection(config: TelegramConfig) -> tuple[bool, str]:
@@ -243,8 +387,7 @@ async def test_telegram_connection(config: TelegramConfig) -> tuple[bool, str]:
         return False, "Chat ID not configured"
 
     try:
-        from telegram import Bot
-        bot = Bot(token=config.bot_token)
+        bot = _get_bot_class()(token=config.bot_token)
 
         # Verify bot is valid
         me = await bot.get_me()
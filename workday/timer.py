@@ -1,22 +1,91 @@
 """Timer daemon for Workday CLI - handles background pomodoro timing."""
 
+import copy
 import json
 import logging
+import math
 import os
+import select
 import signal
 import sys
 import time
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from .config import ConfigManager, Config
-from .models import TimerState, TimerStatus, BreakType, Pomodoro
-from .storage import Storage
+from .models import TimerState, TimerStatus, BreakType
+from .storage import Storage, close_open_storages
 from .telegram_bot import TelegramNotifier
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Sent by skip() to end the current focus or break period
+SKIP_SIGNAL = signal.SIGRTMIN
+
+# Signals the daemon reacts to. They stay blocked while it runs and are taken
+# with sigtimedwait, so the loop sleeps until a phase ends or one arrives.
+TIMER_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGUSR1, signal.SIGUSR2, SKIP_SIGNAL)
+
+# Seconds stop() waits for the daemon to exit
+STOP_TIMEOUT = 1.0
+
+
+def _wait_for_exit(pid: int, timeout: float) -> None:
+    """Wait until a process exits or the timeout elapses.
+
+    Blocks on a pidfd (Linux 5.3+), which becomes readable when the process
+    exits; elsewhere falls back to probing the process every 100ms.
+
+    Args:
+        pid: Process ID to wait for
+        timeout: Maximum seconds to wait
+    """
+    try:
+        pidfd = os.pidfd_open(pid)
+    except ProcessLookupError:
+        return
+    except (AttributeError, OSError):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(0.1)
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                return
+        return
+
+    try:
+        poller = select.poll()
+        poller.register(pidfd, select.POLLIN)
+        poller.poll(timeout * 1000)
+    finally:
+        os.close(pidfd)
+
+
+def _dump_state(state: TimerState) -> bytes:
+    """Serialize timer state as compact JSON, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(state.to_dict())
+    return json.dumps(state.to_dict(), separators=(",", ":")).encode()
+
+
+def _parse_state(data: bytes) -> TimerState:
+    """Deserialize timer state written by _dump_state()."""
+    if orjson is not None:
+        return TimerState.from_dict(orjson.loads(data))
+    return TimerState.from_dict(json.loads(data))
+
+
+# State file path -> ((inode, mtime_ns, size), parsed state). The daemon
+# replaces the file on every write, so an unchanged stat means an unchanged
+# file and long-running readers skip the parse.
+_state_cache: dict[Path, tuple[tuple[int, int, int], TimerState]] = {}
+
 
 class TimerDaemon:
     """Background timer daemon process."""
@@ -29,39 +98,149 @@ class TimerDaemon:
         """
         self.config_manager = config_manager
         self.config = config_manager.load()
-        self.storage = Storage(config_manager.db_file)
-        self.notifier = TelegramNotifier(self.config.telegram)
+        # Opened on first use: status, pause, resume, skip and stop only
+        # touch the PID and state files
+        self._storage: Optional[Storage] = None
+        self._notifier: Optional[TelegramNotifier] = None
+        # Timer state file path, fixed for the life of the config manager
+        self._state_path = config_manager.state_file
 
         self.state = TimerState()
         self._running = False
-        self._break_counter = 0  # Tracks alternating breaks
+        self._break_counter = 0  # Index of the next break in the schedule
+        self._saved_state: Optional[bytes] = None  # Last JSON written to the state file
+        self._dirty = False  # State changed since the last _save_state()
+        self._deadline = 0.0  # time.monotonic() at which the current phase ends
+        self._pause_started: Optional[float] = None  # time.monotonic() when paused
+        self._signal_handlers = {
+            signal.SIGTERM: self._signal_handler,
+            signal.SIGINT: self._signal_handler,
+            signal.SIGUSR1: self._pause_signal_handler,
+            signal.SIGUSR2: self._resume_signal_handler,
+            SKIP_SIGNAL: self._skip_signal_handler,
+        }
+
+    @property
+    def storage(self) -> Storage:
+        """Get the daemon's storage, opening it on first use."""
+        if self._storage is None:
+            self._storage = Storage(self.config_manager.db_file)
+        return self._storage
+
+    @property
+    def notifier(self) -> TelegramNotifier:
+        """Get the daemon's notifier, creating it on first use."""
+        if self._notifier is None:
+            self._notifier = TelegramNotifier(self.config.telegram, background=True)
+        return self._notifier
 
     def _save_state(self) -> None:
-        """Save current state to file."""
-        self.config_manager.ensure_dirs()
-        with open(self.config_manager.state_file, "w") as f:
-            json.dump(self.state.to_dict(), f, indent=2)
+        """Save current state to file, skipping the write if nothing changed.
+
+        Not reentrant, and never needs to be: TIMER_SIGNALS stay blocked for
+        the whole session and their handlers only run from _wait().
+        """
+        data = _dump_state(self.state)
+        self._dirty = False
+        if data == self._saved_state:
+            return
+        self._atomic_write_state(data)
+        self._saved_state = data
+
+    def _atomic_write_state(self, data: bytes) -> None:
+        """Replace the state file in one step so readers never see a partial write.
+
+        The data is written to a per-process temporary file and renamed over
+        the state file. No fsync: the state is rebuilt on every start.
+
+        Args:
+            data: Serialized state
+        """
+        state_file = self._state_path
+        tmp = state_file.with_name(f"{state_file.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, state_file)
+
+    def _mark_dirty(self) -> None:
+        """Note a state change to be written by the next _flush_state()."""
+        self._dirty = True
+
+    def _flush_state(self) -> None:
+        """Save state if it changed since the last save."""
+        if self._dirty:
+            self._save_state()
 
     def _load_state(self) -> Optional[TimerState]:
         """Load state from file.
 
+        The parsed state is cached per file and reused while the file's stat
+        is unchanged; only the time remaining is recomputed.
+
         Returns:
             TimerState if file exists and is valid, None otherwise
         """
-        if not self.config_manager.state_file.exists():
+        path = self._state_path
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
             return None
 
+        key = (st.st_ino, st.st_mtime_ns, st.st_size)
+        cached = _state_cache.get(path)
+        if cached is not None and cached[0] == key:
+            state = copy.copy(cached[1])
+            if state.ends_at is not None:
+                state.time_remaining_seconds = max(0, math.ceil(state.ends_at - time.time()))
+            return state
+
         try:
-            with open(self.config_manager.state_file) as f:
-                data = json.load(f)
-                return TimerState.from_dict(data)
+            with open(path, "rb") as f:
+                state = _parse_state(f.read())
         except Exception as e:
             logger.error(f"Failed to load state: {e}")
             return None
 
+        _state_cache[path] = (key, state)
+        return copy.copy(state)
+
     def _clear_state(self) -> None:
         """Remove state file."""
-        self.config_manager.state_file.unlink(missing_ok=True)
+        self._state_path.unlink(missing_ok=True)
+
+    def _start_phase(self, seconds: int) -> None:
+        """Start the countdown for a focus or break phase.
+
+        Args:
+            seconds: Length of the phase
+        """
+        self._deadline = time.monotonic() + seconds
+        self._pause_started = None
+        self.state.time_remaining_seconds = seconds
+        self.state.ends_at = time.time() + seconds
+
+    def _remaining(self) -> float:
+        """Seconds left in the current phase, frozen while paused."""
+        now = time.monotonic() if self._pause_started is None else self._pause_started
+        return max(0.0, self._deadline - now)
+
+    def _wait(self, timeout: Optional[float]) -> None:
+        """Sleep until the timeout elapses or a timer signal arrives.
+
+        Every pending signal is handled before the state is saved, so a
+        burst of them (e.g. pause then resume) costs a single write.
+
+        Args:
+            timeout: Maximum seconds to sleep, or None to wait for a signal
+        """
+        if timeout is None:
+            info = signal.sigwaitinfo(TIMER_SIGNALS)
+        else:
+            info = signal.sigtimedwait(TIMER_SIGNALS, timeout)
+        while info is not None:
+            self._signal_handlers[info.si_signo](info.si_signo, None)
+            info = signal.sigtimedwait(TIMER_SIGNALS, 0)
+        self._flush_state()
 
     def _signal_handler(self, signum, frame):
         """Handle termination signals."""
@@ -71,17 +250,37 @@ class TimerDaemon:
     def _pause_signal_handler(self, signum, frame):
         """Handle pause signal (SIGUSR1)."""
         if self.state.status != TimerStatus.PAUSED:
+            self._pause_started = time.monotonic()
             self.state.status = TimerStatus.PAUSED
-            self._save_state()
+            self.state.time_remaining_seconds = math.ceil(self._remaining())
+            self.state.ends_at = None
+            self._mark_dirty()
+
+    def _skip_signal_handler(self, signum, frame):
+        """Handle skip signal (SKIP_SIGNAL) by ending the current period."""
+        if self._pause_started is None:
+            self._deadline = time.monotonic()
+        else:
+            # Stays paused; the transition happens on resume
+            self._deadline = self._pause_started
+            self.state.time_remaining_seconds = 0
+            self._mark_dirty()
 
     def _resume_signal_handler(self, signum, frame):
         """Handle resume signal (SIGUSR2)."""
         if self.state.status == TimerStatus.PAUSED:
+            # Push the deadline back by however long the timer was paused
+            self._deadline += time.monotonic() - self._pause_started
+            self._pause_started = None
             self.state.status = TimerStatus.FOCUS if self.state.break_type is None else TimerStatus.BREAK
-            self._save_state()
+            self.state.ends_at = time.time() + self._remaining()
+            self._mark_dirty()
 
     def _daemonize(self) -> None:
         """Fork process to background."""
+        # The daemon must not inherit this process's SQLite connections
+        close_open_storages()
+
         # First fork
         try:
             pid = os.fork()
@@ -110,12 +309,12 @@ class TimerDaemon:
         sys.stdout.flush()
         sys.stderr.flush()
 
-        # Redirect to /dev/null
-        with open("/dev/null", "r") as devnull:
-            os.dup2(devnull.fileno(), sys.stdin.fileno())
-        with open("/dev/null", "w") as devnull:
-            os.dup2(devnull.fileno(), sys.stdout.fileno())
-            os.dup2(devnull.fileno(), sys.stderr.fileno())
+        # Redirect to /dev/null through one read-write descriptor
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (sys.stdin.fileno(), sys.stdout.fileno(), sys.stderr.fileno()):
+            os.dup2(devnull, fd)
+        if devnull > 2:
+            os.close(devnull)
 
         # Save PID
         self.config_manager.set_pid(os.getpid())
@@ -140,60 +339,64 @@ class TimerDaemon:
         if existing_pid:
             raise RuntimeError(f"Timer already running (PID {existing_pid})")
 
+        # The state file is written into this directory for the rest of the
+        # session
+        self.config_manager.ensure_dirs()
+
+        # Block the timer signals before the PID file is written, so one
+        # sent as soon as the daemon is visible waits for _wait() instead of
+        # hitting the default action. _wait() takes them and dispatches to
+        # self._signal_handlers on this thread; handlers never interrupt the
+        # loop. Threads started from here on inherit the mask, so the
+        # signals cannot be delivered anywhere else.
+        previous_mask = signal.pthread_sigmask(signal.SIG_BLOCK, TIMER_SIGNALS)
+
         if daemonize:
             self._daemonize()
 
-        # Set up signal handlers
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
-        signal.signal(signal.SIGUSR1, self._pause_signal_handler)
-        signal.signal(signal.SIGUSR2, self._resume_signal_handler)
-
-        # Initialize state
-        self.state = TimerState(
-            status=TimerStatus.FOCUS,
-            current_pomodoro=starting_pomodoro,
-            time_remaining_seconds=self.config.timer.focus_minutes * 60,
-            started_at=datetime.now(),
-            current_task_id=task_id,
-            day_id=day_id,
-        )
-        self._break_counter = 0
-        self._running = True
-
-        # Get task name for notifications
-        task_name = None
-        if task_id:
-            task = self.storage.get_task(task_id)
-            if task:
-                task_name = task.description
-
-        # Notify focus start
-        self.notifier.notify_focus_start(self.state.current_pomodoro, task_name)
-
-        # Create pomodoro record
-        pomodoro = Pomodoro(
-            day_id=day_id,
-            task_id=task_id,
-            started_at=datetime.now(),
-            duration_minutes=self.config.timer.focus_minutes,
-        )
-        pomodoro = self.storage.create_pomodoro(pomodoro)
-        current_pomodoro_id = pomodoro.id
+        try:
+            # Initialize state
+            self.state = TimerState(
+                status=TimerStatus.FOCUS,
+                current_pomodoro=starting_pomodoro,
+                time_remaining_seconds=self.config.timer.focus_minutes * 60,
+                started_at=time.time(),
+                current_task_id=task_id,
+                day_id=day_id,
+            )
+            self._start_phase(self.config.timer.focus_minutes * 60)
+            self._break_counter = 0
+            self._running = True
+
+            # Get task name for notifications
+            task_name = None
+            if task_id:
+                task = self.storage.get_task(task_id)
+                if task:
+                    task_name = task.description
+
+            # Notify focus start
+            self.notifier.notify_focus_start(self.state.current_pomodoro, task_name)
+
+            # Create pomodoro record
+            current_pomodoro_id = self.storage.start_pomodoro(
+                day_id, task_id, self.state.started_at, self.config.timer.focus_minutes
+            )
 
-        self._save_state()
+            self._save_state()
 
-        # Main timer loop
-        try:
-            self._run_loop(day_id, task_id, current_pomodoro_id)
+            # Main timer loop
+            self._run_loop(day_id, task_id, current_pomodoro_id, task_name)
         finally:
             self._cleanup()
+            signal.pthread_sigmask(signal.SIG_SETMASK, previous_mask)
 
     def _run_loop(
         self,
         day_id: int,
         task_id: Optional[int],
         current_pomodoro_id: int,
+        task_name: Optional[str] = None,
     ) -> None:
         """Main timer loop.
 
@@ -201,103 +404,80 @@ class TimerDaemon:
             day_id: Day ID
             task_id: Task ID
             current_pomodoro_id: Current pomodoro record ID
+            task_name: Task description for notifications, looked up once by start()
         """
+        # Settings and collaborators are fixed for the session
+        timer_config = self.config.timer
+        focus_minutes = timer_config.focus_minutes
+        focus_seconds = focus_minutes * 60
+        short_break_minutes = timer_config.short_break_minutes
+        long_break_minutes = timer_config.long_break_minutes
+        # One cycle of (break type, minutes): short breaks alternate email
+        # and rest, and every long_break_after-th break is a long one
+        cycle = max(1, timer_config.long_break_after)
+        break_schedule = [
+            (BreakType.EMAIL if i % 2 == 0 else BreakType.REST, short_break_minutes)
+            for i in range(cycle - 1)
+        ]
+        break_schedule.append((BreakType.LONG, long_break_minutes))
+        state = self.state
+        storage = self.storage
+        notifier = self.notifier
+
         while self._running:
-            # Check for external skip command via state file
-            external_state = self._load_state()
-            if external_state and external_state.time_remaining_seconds == 0 and self.state.time_remaining_seconds > 0:
-                self.state.time_remaining_seconds = 0
-
-            # Skip time if paused (pause/resume handled via signals)
-            if self.state.status == TimerStatus.PAUSED:
-                time.sleep(1)
-                self._save_state()
+            # Nothing to count while paused; block with no timeout until a
+            # signal (resume, skip or stop) arrives
+            if state.status == TimerStatus.PAUSED:
+                self._wait(None)
                 continue
 
-            # Count down
-            if self.state.time_remaining_seconds > 0:
-                time.sleep(1)
-                self.state.time_remaining_seconds -= 1
-                self._save_state()
+            # Sleep until the deadline; signals (pause, skip, stop) wake it early
+            remaining = self._remaining()
+            if remaining > 0:
+                self._wait(remaining)
                 continue
 
             # Timer completed - handle transition
-            if self.state.status == TimerStatus.FOCUS:
-                # Focus session complete
-                self.storage.complete_pomodoro(current_pomodoro_id)
-
-                # Update day's actual pomodoro count
-                day = self.storage.get_day(day_id)
-                if day:
-                    day.actual_pomodoros += 1
-                    self.storage.update_day(day)
-
-                self.notifier.notify_focus_complete(self.state.current_pomodoro)
-
+            if state.status == TimerStatus.FOCUS:
                 # Determine break type
-                self._break_counter += 1
-
-                # Long break every N pomodoros
-                if self._break_counter >= self.config.timer.long_break_after:
-                    break_type = BreakType.LONG
-                    break_minutes = self.config.timer.long_break_minutes
-                    self._break_counter = 0
-                else:
-                    # Alternate between email and rest breaks
-                    if self._break_counter % 2 == 1:
-                        break_type = BreakType.EMAIL
-                        if day:
-                            day.email_breaks += 1
-                            self.storage.update_day(day)
-                    else:
-                        break_type = BreakType.REST
-                        if day:
-                            day.rest_breaks += 1
-                            self.storage.update_day(day)
-                    break_minutes = self.config.timer.short_break_minutes
-
-                # Start break
-                self.state.status = TimerStatus.BREAK
-                self.state.break_type = break_type
-                self.state.time_remaining_seconds = break_minutes * 60
+                break_type, break_minutes = break_schedule[self._break_counter]
+                self._break_counter = (self._break_counter + 1) % cycle
+
+                # Start break before any database or notifier work so the
+                # break's clock starts at the phase boundary
+                state.status = TimerStatus.BREAK
+                state.break_type = break_type
+                self._start_phase(break_minutes * 60)
                 self._save_state()
 
-                self.notifier.notify_break_start(break_type, break_minutes)
+                # Focus session complete; a trigger bumps the day's pomodoro
+                # count and the break is counted in the same transaction
+                storage.finish_focus(current_pomodoro_id, day_id, break_type)
 
-            elif self.state.status == TimerStatus.BREAK:
-                # Break complete
-                self.notifier.notify_break_end()
+                notifier.notify_focus_complete(state.current_pomodoro)
+                notifier.notify_break_start(break_type, break_minutes)
 
-                # Start next pomodoro
-                self.state.current_pomodoro += 1
-                self.state.status = TimerStatus.FOCUS
-                self.state.break_type = None
-                self.state.time_remaining_seconds = self.config.timer.focus_minutes * 60
-                self.state.started_at = datetime.now()
+            elif state.status == TimerStatus.BREAK:
+                # Break complete; start next pomodoro
+                state.current_pomodoro += 1
+                state.status = TimerStatus.FOCUS
+                state.break_type = None
+                self._start_phase(focus_seconds)
+                state.started_at = time.time()
                 self._save_state()
 
-                # Get task name
-                task_name = None
-                if task_id:
-                    task = self.storage.get_task(task_id)
-                    if task:
-                        task_name = task.description
-
-                self.notifier.notify_focus_start(self.state.current_pomodoro, task_name)
+                notifier.notify_break_end()
+                notifier.notify_focus_start(state.current_pomodoro, task_name)
 
                 # Create new pomodoro record
-                pomodoro = Pomodoro(
-                    day_id=day_id,
-                    task_id=task_id,
-                    started_at=datetime.now(),
-                    duration_minutes=self.config.timer.focus_minutes,
+                current_pomodoro_id = storage.start_pomodoro(
+                    day_id, task_id, state.started_at, focus_minutes
                 )
-                pomodoro = self.storage.create_pomodoro(pomodoro)
-                current_pomodoro_id = pomodoro.id
 
     def _cleanup(self) -> None:
         """Clean up on exit."""
         self.state.status = TimerStatus.STOPPED
+        self.state.ends_at = None
         self._save_state()
         self.config_manager.clear_pid()
 
@@ -313,13 +493,7 @@ class TimerDaemon:
 
         try:
             os.kill(pid, signal.SIGTERM)
-            # Wait for process to exit
-            for _ in range(10):
-                time.sleep(0.1)
-                try:
-                    os.kill(pid, 0)
-                except ProcessLookupError:
-                    break
+            _wait_for_exit(pid, STOP_TIMEOUT)
             self.config_manager.clear_pid()
             return True
         except ProcessLookupError:
@@ -369,11 +543,10 @@ class TimerDaemon:
 
         try:
             os.kill(pid, signal.SIGUSR2)
-            # Wait a moment for state to update
-            time.sleep(0.1)
-            state = self._load_state()
+            # The remaining time is frozen while paused, so the state read
+            # above already holds what the resumed timer counts down from
             from .display import format_time
-            time_str = format_time(state.time_remaining_seconds) if state else "unknown"
+            time_str = format_time(state.time_remaining_seconds)
             self.notifier.notify_timer_resumed(time_str)
             return True
         except ProcessLookupError:
@@ -385,16 +558,19 @@ class TimerDaemon:
         Returns:
             True if skipped, False if not running
         """
+        pid = self.config_manager.get_pid()
+        if not pid:
+            return False
+
         state = self._load_state()
         if not state or state.status == TimerStatus.STOPPED:
             return False
 
-        # Set remaining time to 0 to trigger transition
-        state.time_remaining_seconds = 0
-        with open(self.config_manager.state_file, "w") as f:
-            json.dump(state.to_dict(), f, indent=2)
-
-        return True
+        try:
+            os.kill(pid, SKIP_SIGNAL)
+            return True
+        except ProcessLookupError:
+            return False
 
     def get_status(self) -> Optional[TimerState]:
         """Get current timer status.